@@ -6,7 +6,7 @@ from faroes.threearcdeecoil import ThreeArcDeeTFSet, ThreeArcDeeTFSetAdaptor
 # from faroes.princetondeecoil import PrincetonDeeTFSet
 from faroes.configurator import UserConfigurator
 
-from faroes.util import PolarParallelCurve
+from faroes.util import PolarParallelCurve, DifferenceKS
 
 import numpy as np
 from scipy.constants import pi
@@ -14,6 +14,33 @@ from scipy.constants import pi
 import matplotlib.pyplot as plt
 
 
+def polar_to_RZ(R0, d_sq, θ):
+    """Convert points given by squared distance and angle from (R0, 0)
+
+    Parameters
+    ----------
+    R0 : float
+        Radius of the polar origin
+    d_sq : array_like
+        Squared distances from the origin
+    θ : array_like
+        Polar angles
+
+    Returns
+    -------
+    R : array_like
+    Z : array_like
+    """
+    d = np.sqrt(d_sq)
+    # build R and Z in the trig buffers rather than allocating temporaries
+    R = np.cos(θ)
+    np.multiply(R, d, out=R)
+    np.add(R, R0, out=R)
+    Z = np.sin(θ)
+    np.multiply(Z, d, out=Z)
+    return R, Z
+
+
 class Machine(om.Group):
     def initialize(self):
         self.options.declare("config")
@@ -66,37 +93,15 @@ class Machine(om.Group):
 
         self.add_subsystem(
             "margin",
-            om.ExecComp(
-                "c = a - b",
-                a={
-                    "units": "m**2",
-                    "shape_by_conn": True
-                },
-                b={
-                    "units": "m**2",
-                    "shape_by_conn": True,
-                    "copy_shape": "a"
-                },
-                c={
-                    "units": "m**2",
-                    "copy_shape": "a"
-                },
-            ))
+            DifferenceKS(units="m**2",
+                         ref=10,
+                         rho=10,
+                         upper=0,
+                         add_constraint=True))
 
         self.connect("coils.d_sq", "margin.a")
         self.connect("exclusion_zone.d_sq", "margin.b")
 
-        self.add_subsystem(
-            'ks',
-            om.KSComp(width=100,
-                      units="m**2",
-                      ref=10,
-                      lower_flag=True,
-                      rho=10,
-                      upper=0,
-                      add_constraint=True))
-        self.connect("margin.c", "ks.g")
-
 
 if __name__ == "__main__":
     prob = om.Problem()
@@ -132,7 +137,7 @@ if __name__ == "__main__":
 
     prob.model.add_objective("machine.V_enc")
 
-    prob.setup(force_alloc_complex=True)
+    prob.setup()
 
     # set the plasma shape
     prob.set_val("R0", 6.0, units="m")
@@ -159,9 +164,8 @@ if __name__ == "__main__":
 
     blanket_d_sq = prob.get_val("machine.exclusion_zone.d_sq")
     blanket_theta = prob.get_val("machine.exclusion_zone.θ_parall")
-    blanket_d = np.sqrt(blanket_d_sq)
-    blanket_R = prob.get_val("R0") + blanket_d * np.cos(blanket_theta)
-    blanket_Z = blanket_d * np.sin(blanket_theta)
+    blanket_R, blanket_Z = polar_to_RZ(prob.get_val("R0"), blanket_d_sq,
+                                       blanket_theta)
 
     fig, ax = plt.subplots()
     machine.plasma.plot(ax)
@@ -1,6 +1,6 @@
 from faroes.configurator import UserConfigurator, Accessor
 from faroes.util import tube_segment_volume
-from faroes.util import tube_segment_volume_derivatives
+from faroes.util import tube_segment_volume_and_derivatives
 
 import openmdao.api as om
 
@@ -322,8 +322,7 @@ class FiniteBuildCentralSolenoid(om.ExplicitComponent):
         J['Φ_single', 'R_out'] = j * mu_0 * pi * r_o**2
         J['Φ_double', 'R_out'] = 2 * J['Φ_single', 'R_out']
 
-        V = tube_segment_volume(r_i, r_o, h)
-        dV = tube_segment_volume_derivatives(r_i, r_o, h)
+        V, dV = tube_segment_volume_and_derivatives(r_i, r_o, h)
         J['V', 'R_in'] = dV['r_i']
         J['V', 'R_out'] = dV['r_o']
         J['V', 'h'] = dV['h']
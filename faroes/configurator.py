@@ -85,6 +85,7 @@ class UserConfigurator():
                              exclude_keys=excl)
 
         self.data = self.default_data
+        self._value_cache = {}
 
         if user_data_file is not None:
             self.update_configuration(user_data_file)
@@ -93,6 +94,7 @@ class UserConfigurator():
         ud = SimpleYamlData(filename)
         updated_data = self._fold_in_new_data(self.data, ud.data, exclude_keys)
         self.data = updated_data
+        self._value_cache = {}
 
     def accessor(self, pre_path):
         """Helper accessor"""
@@ -107,6 +109,12 @@ class UserConfigurator():
         if isinstance(path, str):
             return self.get_value((path, ), units=units)
 
+        # the same constants are requested by every instance of a component,
+        # and again on each call to setup
+        cache_key = (tuple(path), units)
+        if cache_key in self._value_cache:
+            return self._value_cache[cache_key]
+
         if units is not None:
             self._validate_unit(units)
 
@@ -117,6 +125,7 @@ class UserConfigurator():
 
         self._validate_entry(entry, units=units, string_acceptable=True)
         value = self._convert_or_pass_through(entry, desired_units=units)
+        self._value_cache[cache_key] = value
         return value
 
     def _fold_in_new_data(self, old_data, new_data, exclude_keys):
@@ -156,8 +156,7 @@ class SimpleEllipticalTFSet(om.ExplicitComponent):
         J["half-height", "elongation_multiplier"] = half_width * κ
 
         # arc length, also known as perimeter
-        Pe = util.ellipse_perimeter_ramanujan(half_width, half_height)
-        dPe = util.ellipse_perimeter_ramanujan_derivatives(
+        Pe, dPe = util.ellipse_perimeter_ramanujan_and_derivatives(
             half_width, half_height)
 
         J["arc length",
@@ -95,7 +95,8 @@ class EllipseLikeGeometry(om.ExplicitComponent):
 
         self.add_output("b", units='m', desc="Minor radius height")
         self.add_output("ε", desc="Inverse aspect ratio")
-        self.add_output("δ", desc="Triangularity")
+        # ellipse-like plasma approximation; never written by compute
+        self.add_output("δ", val=0, desc="Triangularity")
         self.add_output("full_plasma_height",
                         units='m',
                         desc="Top to bottom of the ellipse")
@@ -134,7 +135,6 @@ class EllipseLikeGeometry(om.ExplicitComponent):
                         desc="Outer radius of plasma at midplane")
 
     def compute(self, inputs, outputs):
-        outputs["δ"] = 0  # ellipse-like plasma approximation
         R0 = inputs["R0"]
         A = inputs["A"]
         a = inputs["a"]
@@ -165,12 +165,12 @@ class EllipseLikeGeometry(om.ExplicitComponent):
         self.declare_partials("b", ["a", "κ"])
         self.declare_partials("ε", ["A"])
         self.declare_partials("full_plasma_height", ["a", "κ"])
-        self.declare_partials("L_pol", ["a", "κ"], method="exact")
-        self.declare_partials("L_pol_simple", ["a", "κ"], method="exact")
-        self.declare_partials("surface area", ["R0", "a", "κ"], method="exact")
+        self.declare_partials("L_pol", ["a", "κ"])
+        self.declare_partials("L_pol_simple", ["a", "κ"])
+        self.declare_partials("surface area", ["R0", "a", "κ"])
 
-        self.declare_partials("V", ["R0", "a", "κa"], method="exact")
-        self.declare_partials("S_c", ["a", "κa"], method="exact")
+        self.declare_partials("V", ["R0", "a", "κa"])
+        self.declare_partials("S_c", ["a", "κa"])
 
         self.declare_partials(["R_in", "R_out"], "R0", val=1)
         self.declare_partials("R_in", "a", val=-1)
@@ -187,8 +187,8 @@ class EllipseLikeGeometry(om.ExplicitComponent):
 
         J["b", "a"] = κ
         J["b", "κ"] = a
-        J["full_plasma_height", "a"] = 2 * κ
-        J["full_plasma_height", "κ"] = 2 * a
+        J["full_plasma_height", "a"] = 2 * J["b", "a"]
+        J["full_plasma_height", "κ"] = 2 * J["b", "κ"]
 
         J["ε", "A"] = -1 / A**2
 
@@ -232,18 +232,12 @@ class EllipticalPlasmaGeometry(om.Group):
 
     def setup(self):
         config = self.options['config']
+        # enforces κa = κ
         self.add_subsystem("kappa",
-                           MenardKappaScaling(config=config),
+                           MenardKappaScaling(config=config,
+                                              perfect_ellipse=True),
                            promotes_inputs=["A"],
-                           promotes_outputs=["κ"])
-        # enforce equality
-        self.add_subsystem("passthrough",
-                           om.ExecComp("kappaa = kappa",
-                                       kappa={'desc': "Elongation"},
-                                       kappaa={'desc': "Elongation"}),
-                           promotes_inputs=[("kappa", "κ")],
-                           promotes_outputs=[("kappaa", "κa")])
-
+                           promotes_outputs=["κ", "κa"])
         self.add_subsystem("geom",
                            EllipseLikeGeometry(),
                            promotes_inputs=["R0", "a", "A", "κ", "κa"],
@@ -1,6 +1,6 @@
 import openmdao.api as om
 from faroes.configurator import UserConfigurator
-from scipy.constants import mu_0, mega, kilo
+from scipy.constants import mu_0, mega
 
 
 class BetaNTotal(om.ExplicitComponent):
@@ -48,8 +48,8 @@ class BetaNTotal(om.ExplicitComponent):
                         units="m * T / MA",
                         desc="Normalized beta, total")
 
-    def β_N_scaling(self, A):
-        """Estimated β_N from A
+    def _β_N_scaling_and_derivative(self, A):
+        """Estimated β_N from A, and its A-derivative
 
         Parameters
         ----------
@@ -61,32 +61,45 @@ class BetaNTotal(om.ExplicitComponent):
         β_N : float
             Normalized total pressure
             Fractional, not %.
-
+        dβ_N/dA : float
+            Derivative of β_N with respect to A
         """
         const = self.β_ε_scaling_constants
         b = const[0]
         c = const[1]
         d = const[2]
-        return (b + c / (A**d)) / 100
+        # a single power serves both the value and the derivative
+        p = A**(-d)
+        return (b + c * p) / 100, -0.01 * c * d * p / A
+
+    def _β_N_law_and_derivative(self, A):
+        """β_N scaling law and its A-derivative, reusing the last compute
+
+        compute_partials is always preceded by a compute at the same point,
+        so the values from that (real-valued) compute are reused when A is
+        unchanged.
+        """
+        cache = getattr(self, "_β_N_cache", None)
+        if cache is not None and cache[0] == A[0]:
+            return cache[1], cache[2]
+        return self._β_N_scaling_and_derivative(A)
 
     def compute(self, inputs, outputs):
         A = inputs["A"]
-        β_N_law = self.β_N_scaling(A)
+        β_N_law, dβ_N_dA = self._β_N_scaling_and_derivative(A)
         outputs["β_N"] = β_N_law
         outputs["β_N total"] = β_N_law * inputs["f"]
+        if not self.under_complex_step:
+            self._β_N_cache = (A[0], β_N_law, dβ_N_dA)
 
     def setup_partials(self):
         self.declare_partials(["β_N", "β_N total"], ["A", "f"])
 
     def compute_partials(self, inputs, J):
-        const = self.β_ε_scaling_constants
         A = inputs["A"]
-        β_N_law = self.β_N_scaling(A)
-        c = const[1]
-        d = const[2]
-        J["β_N", "A"] = -0.01 * A**(-d - 1) * c * d
-        scale = inputs["f"]
-        J["β_N total", "A"] = scale * J["β_N", "A"]
+        β_N_law, dβ_N_dA = self._β_N_law_and_derivative(A)
+        J["β_N", "A"] = dβ_N_dA
+        J["β_N total", "A"] = inputs["f"] * dβ_N_dA
         J["β_N total", "f"] = β_N_law
 
 
@@ -149,10 +162,12 @@ class BetaToroidal(om.ExplicitComponent):
         Bt = inputs["Bt"]
         a = inputs["a"]
         βN_tot = inputs["β_N total"]
-        J["βt", "Ip"] = βN_tot / (Bt * a)
-        J["βt", "β_N total"] = Ip / (Bt * a)
-        J["βt", "Bt"] = -Ip * βN_tot / (Bt**2 * a)
-        J["βt", "a"] = -Ip * βN_tot / (Bt * a**2)
+        inv_Bt_a = 1 / (Bt * a)
+        βt = Ip * βN_tot * inv_Bt_a
+        J["βt", "Ip"] = βN_tot * inv_Bt_a
+        J["βt", "β_N total"] = Ip * inv_Bt_a
+        J["βt", "Bt"] = -βt / Bt
+        J["βt", "a"] = -βt / a
 
 
 class SpecifiedTotalAveragePressure(om.ExplicitComponent):
@@ -180,7 +195,7 @@ class SpecifiedTotalAveragePressure(om.ExplicitComponent):
     Outputs
     -------
     <p_tot> : float
-        kPa, Total specified average pressure
+        Pa, Total specified average pressure
 
     Notes
     -----
@@ -197,9 +212,9 @@ class SpecifiedTotalAveragePressure(om.ExplicitComponent):
         self.add_input("βt", desc="Toroidal beta")
         self.add_input("<(R0/R)^2>", val=1, desc="Geometric shaping factor")
 
-        p_ref = 10**5
+        p_ref = 10**8
         self.add_output("<p_tot>",
-                        units="kPa",
+                        units="Pa",
                         ref=p_ref,
                         lower=0,
                         desc="Volume-averaged total pressure")
@@ -209,7 +224,7 @@ class SpecifiedTotalAveragePressure(om.ExplicitComponent):
         Bt = inputs["Bt"]
         f_shaping = inputs["<(R0/R)^2>"]
         p_avg = f_shaping * βt * (Bt**2 / (2 * mu_0))
-        outputs["<p_tot>"] = p_avg / kilo
+        outputs["<p_tot>"] = p_avg
 
     def setup_partials(self):
         self.declare_partials("<p_tot>", ["βt", "Bt", "<(R0/R)^2>"])
@@ -218,9 +233,12 @@ class SpecifiedTotalAveragePressure(om.ExplicitComponent):
         βt = inputs["βt"]
         Bt = inputs["Bt"]
         f_shaping = inputs["<(R0/R)^2>"]
-        J["<p_tot>", "βt"] = f_shaping * (Bt**2 / (2 * mu_0)) / kilo
-        J["<p_tot>", "Bt"] = f_shaping * βt * Bt / (mu_0) / kilo
-        J["<p_tot>", "<(R0/R)^2>"] = βt * (Bt**2 / (2 * mu_0)) / kilo
+        # magnetic pressure and its derivative
+        dp_B_dBt = Bt / mu_0
+        p_B = Bt * dp_B_dBt / 2
+        J["<p_tot>", "βt"] = f_shaping * p_B
+        J["<p_tot>", "Bt"] = f_shaping * βt * dp_B_dBt
+        J["<p_tot>", "<(R0/R)^2>"] = βt * p_B
 
 
 class BPoloidal(om.ExplicitComponent):
@@ -270,8 +288,9 @@ class BPoloidal(om.ExplicitComponent):
     def compute_partials(self, inputs, J):
         Ip = inputs["Ip"]
         L_pol = inputs["L_pol"]
-        J["Bp", "Ip"] = mu_0 * mega / L_pol
-        J["Bp", "L_pol"] = -mu_0 * mega * Ip / L_pol**2
+        dBp_dIp = mu_0 * mega / L_pol
+        J["Bp", "Ip"] = dBp_dIp
+        J["Bp", "L_pol"] = -dBp_dIp * Ip / L_pol
 
 
 class BetaPoloidal(om.ExplicitComponent):
@@ -284,7 +303,7 @@ class BetaPoloidal(om.ExplicitComponent):
     Inputs
     ------
     <p_tot> : float
-        kPa, total averaged pressure
+        Pa, total averaged pressure
     Bp : float
         T, Averaged poloidal field at LCFS
 
@@ -295,7 +314,7 @@ class BetaPoloidal(om.ExplicitComponent):
     """
     def setup(self):
         self.add_input("<p_tot>",
-                       units="kPa",
+                       units="Pa",
                        desc="Volume-averaged total pressure")
         self.add_input("Bp", units="T", desc="Average poloidal field at LCFS")
         self.add_output("βp", desc="Poloidal beta")
@@ -303,7 +322,7 @@ class BetaPoloidal(om.ExplicitComponent):
     def compute(self, inputs, outputs):
         Bp = inputs["Bp"]
         p_tot = inputs["<p_tot>"]
-        βp = p_tot * kilo * 2 * mu_0 / Bp**2
+        βp = p_tot * 2 * mu_0 / Bp**2
         outputs["βp"] = βp
 
     def setup_partials(self):
@@ -312,9 +331,10 @@ class BetaPoloidal(om.ExplicitComponent):
     def compute_partials(self, inputs, J):
         Bp = inputs["Bp"]
         p_tot = inputs["<p_tot>"]
-        p_tot * kilo * 2 * mu_0 / Bp**2
-        J["βp", "Bp"] = -2 * p_tot * kilo * 2 * mu_0 / Bp**3
-        J["βp", "<p_tot>"] = kilo * 2 * mu_0 / Bp**2
+        dβp_dp = 2 * mu_0 / Bp**2
+        βp = p_tot * dβp_dp
+        J["βp", "Bp"] = -2 * βp / Bp
+        J["βp", "<p_tot>"] = dβp_dp
 
 
 class SpecifiedPressure(om.Group):
@@ -344,7 +364,7 @@ class SpecifiedPressure(om.Group):
     βp : float
         Poloidal beta
     <p_tot> : float
-        kPa, Total specified average pressure
+        Pa, Total specified average pressure
     """
     def initialize(self):
         self.options.declare('config', default=None, recordable=False)
@@ -227,6 +227,35 @@ class SauterGeometry(om.ExplicitComponent):
                         desc="Normalized geometric β adj. factor")
         self.add_output("δ_out", desc="Passthrough of δ")
 
+    @staticmethod
+    def boundary(R0, a, κ, δ, ξ, θ):
+        r"""LCFS points for one or many sets of shape parameters
+
+        Evaluates equations (1) and (2) outside of a model, for example in
+        parameter sweeps. The shape parameters may be scalars or arrays of a
+        common shape (M,); the boundary is evaluated on all of them at once.
+
+        Parameters
+        ----------
+        R0, a, κ, δ, ξ : float or array_like
+            Shape parameters, as for the component inputs
+        θ : array_like
+            Poloidal angles, of length nθ
+
+        Returns
+        -------
+        R, Z : ndarray
+            Boundary locations, of shape (M, nθ), or (nθ,) for scalar
+            shape parameters
+        """
+        R0, a, κ, δ, ξ = (np.expand_dims(np.asarray(x), -1)
+                          for x in (R0, a, κ, δ, ξ))
+        θ = np.asarray(θ)
+        s2θ = sin(2 * θ)
+        R = R0 + a * cos(θ + δ * sin(θ) - ξ * s2θ)
+        Z = κ * a * sin(θ + ξ * s2θ)
+        return R, Z
+
     def R02_over_R2_normalized_integrand(self, θ, A, δ=0, ξ=0):
         r"""
         Equals 2 z(θ) 2 π r(θ)^{-1} dr/dθ
@@ -243,6 +272,95 @@ class SauterGeometry(om.ExplicitComponent):
         # so in total we've divided by 2 π a³ κ
         return -2 * A**2 * zn * drn_dθ / rn
 
+    def R02_over_R2_normalized_integrand_derivative(self, θ, wrt, A, δ, ξ):
+        r"""
+        Derivative of :meth:`R02_over_R2_normalized_integrand`
+
+        Parameters
+        ----------
+        wrt : str
+            One of "A", "δ", or "ξ"
+        """
+        sθ = sin(θ)
+        s2θ = sin(2 * θ)
+        φ_R = θ + δ * sθ - ξ * s2θ
+        φ_Z = θ + ξ * s2θ
+        sφ_R = sin(φ_R)
+        cφ_R = cos(φ_R)
+        zn = sin(φ_Z)
+        rn = A + cφ_R
+        g = 1 + δ * cos(θ) - 2 * ξ * cos(2 * θ)
+        drn_dθ = -g * sφ_R
+
+        if wrt == "A":
+            f = -2 * A**2 * zn * drn_dθ / rn
+            return f * (2 / A - 1 / rn)
+        elif wrt == "δ":
+            dzn = 0
+            drn = -sφ_R * sθ
+            ddrn_dθ = -cos(θ) * sφ_R - g * cφ_R * sθ
+        elif wrt == "ξ":
+            dzn = cos(φ_Z) * s2θ
+            drn = sφ_R * s2θ
+            ddrn_dθ = 2 * cos(2 * θ) * sφ_R + g * cφ_R * s2θ
+        else:
+            raise ValueError(f"Unknown wrt {wrt}")
+        return -2 * A**2 * (dzn * drn_dθ / rn + zn * ddrn_dθ / rn -
+                            zn * drn_dθ * drn / rn**2)
+
+    def _θ_trig(self, θ):
+        """sin θ, cos θ, sin 2θ, and cos 2θ for the boundary angles
+
+        The angles are usually fixed for a whole run, so the table is kept
+        and reused until θ changes.
+        """
+        cache = getattr(self, "_θ_trig_cache", None)
+        if cache is not None and np.array_equal(cache[0], θ):
+            return cache[1]
+        trig = (sin(θ), cos(θ), sin(2 * θ), cos(2 * θ))
+        if not self.under_complex_step:
+            self._θ_trig_cache = (θ.copy(), trig)
+        return trig
+
+    def _phase_trig(self, θ, δ, ξ):
+        """sin and cos of the phases in equations (1) and (2)
+
+        Returns sin and cos of θ + δ sin θ - ξ sin 2θ, and then of
+        θ + ξ sin 2θ. compute_partials is always preceded by a compute at
+        the same point, so the values from that (real-valued) compute are
+        reused.
+        """
+        key = (δ[0], ξ[0])
+        cache = getattr(self, "_phase_trig_cache", None)
+        if (cache is not None and cache[0] == key
+                and np.array_equal(cache[1], θ)):
+            return cache[2]
+        sθ, cθ, s2θ, c2θ = self._θ_trig(θ)
+        φ_R = θ + δ * sθ - ξ * s2θ
+        φ_Z = θ + ξ * s2θ
+        trig = (sin(φ_R), cos(φ_R), sin(φ_Z), cos(φ_Z))
+        if not self.under_complex_step:
+            self._phase_trig_cache = (key, θ.copy(), trig)
+        return trig
+
+    def _R02_over_R(self, A, δ, ξ):
+        """Quadrature of R02_over_R2_normalized_integrand over 0 to π
+
+        compute_partials is always preceded by a compute at the same
+        point, so the value from that (real-valued) compute is reused.
+        """
+        key = (A[0], δ[0], ξ[0])
+        cache = getattr(self, "_R02_over_R_cache", None)
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        R02_over_R, _ = quad(self.R02_over_R2_normalized_integrand,
+                             0,
+                             pi,
+                             args=(A, δ, ξ))
+        if not self.under_complex_step:
+            self._R02_over_R_cache = (key, R02_over_R)
+        return R02_over_R
+
     def compute(self, inputs, outputs):
         outputs["Z0"] = 0
 
@@ -254,6 +372,8 @@ class SauterGeometry(om.ExplicitComponent):
         ξ = inputs["ξ"]
 
         θ = inputs["θ"]
+        sθ, cθ, s2θ, c2θ = self._θ_trig(θ)
+        sφ_R, cφ_R, sφ_Z, cφ_Z = self._phase_trig(θ, δ, ξ)
 
         # Sauter equation (C.2)
         # but using the 'alternate expression for a quadratic root'
@@ -271,17 +391,18 @@ class SauterGeometry(om.ExplicitComponent):
 
         outputs["L_pol"] = L_p
 
-        # Equation (1)
-        R = R0 + a * cos(θ + δ * sin(θ) - ξ * sin(2 * θ))
-        # Equation (2)
-        Z = κ * a * sin(θ + ξ * sin(2 * θ))
-
         b = κ * a
         outputs["b"] = b
         outputs["full_plasma_height"] = 2 * b
 
-        outputs["R"] = R
-        outputs["Z"] = Z
+        # the boundary arrays are written into the output vectors directly
+        # Equation (1)
+        R = outputs["R"]
+        np.multiply(a, cφ_R, out=R)
+        R += R0
+        # Equation (2)
+        Z = outputs["Z"]
+        np.multiply(b, sφ_Z, out=Z)
 
         ε = 1 / A
         outputs["ε"] = ε
@@ -303,19 +424,17 @@ class SauterGeometry(om.ExplicitComponent):
         outputs["R_out"] = R0 + a
         outputs["w07"] = w07
 
-        dR_dθ = -a * (1 + δ * cos(θ) - 2 * ξ *
-                      cos(2 * θ)) * sin(θ + δ * sin(θ) - ξ * sin(2 * θ))
-        dZ_dθ = a * κ * (1 + 2 * ξ * cos(2 * θ)) * cos(θ + ξ * sin(2 * θ))
-        outputs["dR_dθ"] = dR_dθ
-        outputs["dZ_dθ"] = dZ_dθ
+        dR_dθ = outputs["dR_dθ"]
+        np.multiply(1 + δ * cθ - 2 * ξ * c2θ, sφ_R, out=dR_dθ)
+        dR_dθ *= -a
+        dZ_dθ = outputs["dZ_dθ"]
+        np.multiply(1 + 2 * ξ * c2θ, cφ_Z, out=dZ_dθ)
+        dZ_dθ *= b
 
         # a normalized volume is V / 2 π a³ κ
         V_n = pi * A * (1 - δ * ε / 4) * (1 + 0.52 * (w07 - 1))
 
-        R02_over_R, _ = quad(self.R02_over_R2_normalized_integrand,
-                             0,
-                             pi,
-                             args=(A, δ, ξ))
+        R02_over_R = self._R02_over_R(A, δ, ξ)
         R02_over_R_ellipse = (2 * A) / (A + np.sqrt(A**2 - 1))
         outputs["<(R0/R)^2>"] = R02_over_R / V_n
         outputs["<(R0/R)^2>n"] = R02_over_R / V_n / R02_over_R_ellipse
@@ -354,8 +473,7 @@ class SauterGeometry(om.ExplicitComponent):
         self.declare_partials("dZ_dθ", ["θ"],
                               rows=range(size),
                               cols=range(size))
-        self.declare_partials("<(R0/R)^2>", ["A", "δ", "ξ"], method="fd")
-        self.declare_partials("<(R0/R)^2>n", ["A", "δ", "ξ"], method="fd")
+        self.declare_partials(["<(R0/R)^2>", "<(R0/R)^2>n"], ["A", "δ", "ξ"])
 
     def compute_partials(self, inputs, J):
         A = inputs["A"]
@@ -369,6 +487,8 @@ class SauterGeometry(om.ExplicitComponent):
         ξ = inputs["ξ"]
 
         θ = inputs["θ"]
+        sθ, cθ, s2θ, c2θ = self._θ_trig(θ)
+        sφ_R, cφ_R, sφ_Z, cφ_Z = self._phase_trig(θ, δ, ξ)
 
         a = R0 / A
         ε = 1 / A
@@ -462,48 +582,68 @@ class SauterGeometry(om.ExplicitComponent):
         J["V", "δ"] = dV_dδ + dV_dSc * J["S_c", "δ"]
         J["V", "ξ"] = dV_dSc * J["S_c", "ξ"]
 
-        J["R", "a"] = cos(θ + δ * sin(θ) - ξ * sin(2 * θ))
+        J["R", "a"] = cφ_R
         J["R", "R0"] = 1
-        J["R", "δ"] = -a * sin(θ) * sin(θ + δ * sin(θ) - ξ * sin(2 * θ))
-        J["R", "ξ"] = a * sin(2 * θ) * sin(θ + δ * sin(θ) - ξ * sin(2 * θ))
+        J["R", "δ"] = -a * sθ * sφ_R
+        J["R", "ξ"] = a * s2θ * sφ_R
+
+        # dφ_R/dθ and dφ_Z/dθ
+        dφ_R = 1 + δ * cθ - 2 * ξ * c2θ
+        dφ_Z = 1 + 2 * ξ * c2θ
 
-        dR_dθ_da = -1 * (1 + δ * cos(θ) - 2 * ξ *
-                         cos(2 * θ)) * sin(θ + δ * sin(θ) - ξ * sin(2 * θ))
+        dR_dθ_da = -dφ_R * sφ_R
         dR_dθ = a * dR_dθ_da
 
         J["R", "θ"] = dR_dθ
 
-        J["Z", "a"] = κ * sin(θ + ξ * sin(2 * θ))
-        J["Z", "κ"] = a * sin(θ + ξ * sin(2 * θ))
-        J["Z", "ξ"] = a * κ * cos(θ + ξ * sin(2 * θ)) * sin(2 * θ)
-        dZ_dθ_da = κ * (1 + 2 * ξ * cos(2 * θ)) * cos(θ + ξ * sin(2 * θ))
+        J["Z", "a"] = κ * sφ_Z
+        J["Z", "κ"] = a * sφ_Z
+        J["Z", "ξ"] = a * κ * cφ_Z * s2θ
+        dZ_dθ_da = κ * dφ_Z * cφ_Z
         dZ_dθ = a * dZ_dθ_da
         J["Z", "θ"] = dZ_dθ
 
         J["dR_dθ", "a"] = dR_dθ_da
-        J["dR_dθ", "δ"] = -a * (1 + δ * cos(θ) - 2 * ξ * cos(2 * θ)) * cos(
-            θ + δ * sin(θ) - ξ * sin(2 * θ)) * sin(θ) - a * cos(θ) * sin(
-                θ + δ * sin(θ) - ξ * sin(2 * θ))
-        J["dR_dθ", "ξ"] = a * (1 + δ * cos(θ) - 2 * ξ * cos(2 * θ)) * cos(
-            θ + δ * sin(θ) - ξ * sin(2 * θ)) * sin(2 * θ) + 2 * a * cos(
-                2 * θ) * sin(θ + δ * sin(θ) - ξ * sin(2 * θ))
-        d2R_dθ2 = -a * (1 + δ * cos(θ) - 2 * ξ * cos(2 * θ))**2 * cos(
-            θ + (δ - 2 * ξ * cos(θ)) * sin(θ)) + a * (δ * sin(θ) - 4 * ξ * sin(
-                2 * θ)) * sin(θ + (δ - 2 * ξ * cos(θ)) * sin(θ))
+        J["dR_dθ", "δ"] = -a * dφ_R * cφ_R * sθ - a * cθ * sφ_R
+        J["dR_dθ", "ξ"] = a * dφ_R * cφ_R * s2θ + 2 * a * c2θ * sφ_R
+        d2R_dθ2 = -a * dφ_R**2 * cφ_R + a * (δ * sθ - 4 * ξ * s2θ) * sφ_R
         J["dR_dθ", "θ"] = d2R_dθ2
 
         J["dZ_dθ", "a"] = dZ_dθ_da
-        J["dZ_dθ",
-          "κ"] = a * (1 + 2 * ξ * cos(2 * θ)) * cos(θ + ξ * sin(2 * θ))
-        J["dZ_dθ", "ξ"] = a * κ * (
-            2 * cos(2 * θ) * cos(θ + ξ * sin(2 * θ)) -
-            (1 + 2 * ξ * cos(2 * θ)) * sin(2 * θ) * sin(θ + ξ * sin(2 * θ)))
-        d2Z_dθ2 = a * κ * (
-            -4 * ξ * cos(θ + ξ * sin(2 * θ)) * sin(2 * θ) -
-            (1 + 2 * ξ * cos(2 * θ))**2 * sin(θ + ξ * sin(2 * θ)))
+        J["dZ_dθ", "κ"] = a * dφ_Z * cφ_Z
+        J["dZ_dθ", "ξ"] = a * κ * (2 * c2θ * cφ_Z - dφ_Z * s2θ * sφ_Z)
+        d2Z_dθ2 = a * κ * (-4 * ξ * cφ_Z * s2θ - dφ_Z**2 * sφ_Z)
         J["dZ_dθ", "θ"] = d2Z_dθ2
 
+        # the integral is differentiated under the integral sign
+        V_n = pi * A * (1 - δ * ε / 4) * (1 + 0.52 * (w07 - 1))
+        dVn_dA = pi * (1 + 0.52 * (w07 - 1))
+        dVn_dw07 = pi * A * (1 - δ * ε / 4) * 0.52
+        dVn_dδ = -pi / 4 * (1 + 0.52 * (w07 - 1)) + dVn_dw07 * J["w07", "δ"]
+        dVn_dξ = dVn_dw07 * J["w07", "ξ"]
+
+        R02_over_R = self._R02_over_R(A, δ, ξ)
+        R02_over_R_ellipse = (2 * A) / (A + np.sqrt(A**2 - 1))
+        dell_dA = -2 / (np.sqrt(A**2 - 1) * (A + np.sqrt(A**2 - 1))**2)
+
+        R02 = R02_over_R / V_n
+        for var, dVn in [("A", dVn_dA), ("δ", dVn_dδ), ("ξ", dVn_dξ)]:
+            dR02_over_R, _ = quad(
+                self.R02_over_R2_normalized_integrand_derivative,
+                0,
+                pi,
+                args=(var, A, δ, ξ))
+            dR02 = dR02_over_R / V_n - R02 * dVn / V_n
+            J["<(R0/R)^2>", var] = dR02
+            J["<(R0/R)^2>n", var] = dR02 / R02_over_R_ellipse
+        J["<(R0/R)^2>n", "A"] -= R02 * dell_dA / R02_over_R_ellipse**2
+
     def plot(self, ax=None, **kwargs):
+        if ax is None:
+            # matplotlib is not a dependency; only import it when needed
+            import matplotlib.pyplot as plt
+            ax = plt.subplot(111)
+
         label = None
         if 'label' in kwargs.keys():
             label = kwargs.pop('label')
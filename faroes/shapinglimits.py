@@ -18,6 +18,9 @@ class MenardKappaScaling(om.ExplicitComponent):
     -------
     config : UserConfigurator
         Configuration tree. Required option.
+    perfect_ellipse : bool
+        If True, ignore the ":math:`κ` area fraction" and
+        set :math:`κ_a = κ`. Default is False.
 
     Inputs
     ------
@@ -37,6 +40,7 @@ class MenardKappaScaling(om.ExplicitComponent):
     """
     def initialize(self):
         self.options.declare('config', default=None, recordable=False)
+        self.options.declare('perfect_ellipse', default=False)
 
     def setup(self):
         if self.options['config'] is not None:
@@ -46,6 +50,8 @@ class MenardKappaScaling(om.ExplicitComponent):
             self.κ_area_frac = ac(["κ area fraction"])
             self.κ_ε_scaling_constants = ac(
                 ["marginal κ-ε scaling", "constants"])
+        if self.options['perfect_ellipse']:
+            self.κ_area_frac = 1
 
         self.add_input("A", desc="Aspect Ratio")
         self.add_output("κ", lower=0, ref=2, desc="Elongation")
@@ -1,11 +1,15 @@
 import openmdao.api as om
 import numpy as np
+import math
 
 from scipy.constants import mu_0, mega
 
 from faroes.configurator import UserConfigurator, Accessor
 from importlib import resources
 
+# field at unit radius from a unit current, in T m / A
+_MU0_OVER_2PI = mu_0 / (2 * np.pi)
+
 
 class WindingPackProperties(om.Group):
     def initialize(self):
@@ -112,34 +116,53 @@ class InnerTFCoilTension(om.ExplicitComponent):
     def setup_partials(self):
         self.declare_partials('T1', ['I_leg', 'B0', 'R0', 'r1', 'r2'])
 
-    def compute(self, inputs, outputs):
-        i_leg = inputs['I_leg']
-        b0 = inputs['B0']
-        R0 = inputs['R0']
-        r1 = inputs['r1']
-        r2 = inputs['r2']
+    def _radial_factors(self, r1, r2):
+        """log(r2/r1), r2 - r1, and the shape factor T1 / (I_leg B0 R0)
 
+        compute_partials is always preceded by a compute at the same point,
+        so the values from that (real-valued) compute are reused.
+        """
+        key = (r1, r2)
+        cache = getattr(self, "_radial_cache", None)
+        if cache is not None and cache[0] == key:
+            return cache[1]
         k = np.log(r2 / r1)
-        T1 = 0.5 * i_leg * b0 * R0 * (r1 + r2 * (k - 1)) / (r2 - r1)
+        Δr = r2 - r1
+        t = (r1 + r2 * (k - 1)) / (2 * Δr)
+        factors = (k, Δr, t)
+        if not self.under_complex_step:
+            self._radial_cache = (key, factors)
+        return factors
+
+    def compute(self, inputs, outputs):
+        # NumPy scalars rather than one-element arrays; these are much
+        # cheaper to operate on and may still be complex
+        i_leg = inputs['I_leg'][0]
+        b0 = inputs['B0'][0]
+        R0 = inputs['R0'][0]
+        r1 = inputs['r1'][0]
+        r2 = inputs['r2'][0]
+
+        k, Δr, t = self._radial_factors(r1, r2)
+        T1 = i_leg * b0 * R0 * t
         outputs['T1'] = T1
 
     def compute_partials(self, inputs, J):
         """ Jacobian of partial derivatives """
 
-        i_leg = inputs['I_leg']
-        b0 = inputs['B0']
-        R0 = inputs['R0']
-        r1 = inputs['r1']
-        r2 = inputs['r2']
+        i_leg = inputs['I_leg'][0]
+        b0 = inputs['B0'][0]
+        R0 = inputs['R0'][0]
+        r1 = inputs['r1'][0]
+        r2 = inputs['r2'][0]
 
-        k = np.log(r2 / r1)
-        J['T1', 'I_leg'] = b0 * R0 * (r1 + r2 * (k - 1)) / ((r2 - r1) * 2)
-        J['T1', 'R0'] = i_leg * b0 * (r1 + r2 * (k - 1)) / ((r2 - r1) * 2)
-        J['T1', 'B0'] = i_leg * R0 * (r1 + r2 * (k - 1)) / ((r2 - r1) * 2)
-        J['T1', 'r1'] = i_leg * R0 * b0 * r2 * (r1 * (k + 1) - r2) \
-            / (2 * r1 * (r1 - r2)**2)
-        J['T1', 'r2'] = - i_leg * R0 * b0 * (r1 * (k + 1) - r2) \
-            / (2 * (r1 - r2)**2)
+        k, Δr, t = self._radial_factors(r1, r2)
+        J['T1', 'I_leg'] = b0 * R0 * t
+        J['T1', 'R0'] = i_leg * b0 * t
+        J['T1', 'B0'] = i_leg * R0 * t
+        dT1_dr2 = -i_leg * R0 * b0 * (r1 * (k + 1) - r2) / (2 * Δr * Δr)
+        J['T1', 'r1'] = -dT1_dr2 * r2 / r1
+        J['T1', 'r2'] = dT1_dr2
 
 
 class FieldAtRadius(om.ExplicitComponent):
@@ -163,6 +186,8 @@ class FieldAtRadius(om.ExplicitComponent):
         m, major radius
     n_coil: int
         number of TF coils
+    B_max : float
+        T, Maximum allowable field on the TF coil conductor
 
     Outputs
     -------
@@ -170,6 +195,9 @@ class FieldAtRadius(om.ExplicitComponent):
         T, central field
     B_on_coil : float
         T, maximum toroidal field on the TF coil conductor
+    constraint_B_on_coil : float
+        Positive if the field on the conductor is below B_max. The magnitude
+        is as if it were specified in Teslas, though the quantity is unitless.
     """
     def setup(self):
         self.add_input('I_leg', units='MA', desc="Current in one TF leg")
@@ -178,6 +206,9 @@ class FieldAtRadius(om.ExplicitComponent):
                        desc="Inboard conductor outer radius")
         self.add_input('R0', units='m', desc="Geometric major radius")
         self.add_input('n_coil', 18, desc="Number of TF coils")
+        self.add_input('B_max',
+                       units='T',
+                       desc="Max allowable field on coil")
 
         self.add_output('B_on_coil',
                         units='T',
@@ -185,24 +216,8 @@ class FieldAtRadius(om.ExplicitComponent):
         self.add_output('B0',
                         units='T',
                         desc="Vacuum toroidal field at geometric center")
-
-    def field_at_radius(self, i, r):
-        """Toroidal field at a given radius
-
-        Parameters
-        ----------
-        i : float
-            total current, A
-        r : float
-            radius, meters
-
-        Returns
-        -------
-        B : float
-            field in Tesla
-        """
-        b = mu_0 * i / (2 * np.pi * r)
-        return b
+        self.add_output('constraint_B_on_coil',
+                        desc="Positive if acceptable field-on-coil")
 
     def compute(self, inputs, outputs):
         n_coil = inputs['n_coil']
@@ -210,18 +225,19 @@ class FieldAtRadius(om.ExplicitComponent):
         R_coil_max = inputs['r_om']
         R0 = inputs['R0']
 
-        i_total_A = mega * n_coil * I_leg_MA
-
-        B_on_coil = self.field_at_radius(i_total_A, R_coil_max)
-        B0 = self.field_at_radius(i_total_A, R0)
+        # B r, which is the same at both radii
+        Br = _MU0_OVER_2PI * mega * n_coil * I_leg_MA
 
+        B_on_coil = Br / R_coil_max
         outputs['B_on_coil'] = B_on_coil
-        outputs['B0'] = B0
+        outputs['B0'] = Br / R0
+        outputs['constraint_B_on_coil'] = inputs['B_max'] - B_on_coil
 
     def setup_partials(self):
-        self.declare_partials('B0', ['I_leg', 'R0'])
-        self.declare_partials('B_on_coil', ['I_leg', 'r_om'])
-        self.declare_partials(["B0", "B_on_coil"], ["n_coil"], method="cs")
+        self.declare_partials('B0', ['I_leg', 'R0', 'n_coil'])
+        self.declare_partials(['B_on_coil', 'constraint_B_on_coil'],
+                              ['I_leg', 'r_om', 'n_coil'])
+        self.declare_partials('constraint_B_on_coil', 'B_max', val=1)
 
     def compute_partials(self, inputs, J):
         n_coil = inputs['n_coil']
@@ -230,13 +246,16 @@ class FieldAtRadius(om.ExplicitComponent):
         R0 = inputs['R0']
 
         # need to be careful about the scaling here, since I_leg is in MA
-        J['B0', 'I_leg'] = mu_0 * mega * n_coil / (2 * np.pi * R0)
-        J['B0', 'R0'] = - mu_0 * mega * n_coil * I_leg_MA \
-            / (2 * np.pi * R0**2)
-        J['B_on_coil', 'I_leg'] = mu_0 * mega * n_coil \
-            / (2 * np.pi * R_coil_max)
-        J['B_on_coil', 'r_om'] = - mu_0 * mega * n_coil * I_leg_MA \
-            / (2 * np.pi * R_coil_max**2)
+        dBr_dI = _MU0_OVER_2PI * mega * n_coil
+        Br = dBr_dI * I_leg_MA
+        J['B0', 'I_leg'] = dBr_dI / R0
+        J['B0', 'R0'] = -Br / R0**2
+        J['B0', 'n_coil'] = Br / (n_coil * R0)
+        J['B_on_coil', 'I_leg'] = dBr_dI / R_coil_max
+        J['B_on_coil', 'r_om'] = -Br / R_coil_max**2
+        J['B_on_coil', 'n_coil'] = Br / (n_coil * R_coil_max)
+        for var in ['I_leg', 'r_om', 'n_coil']:
+            J['constraint_B_on_coil', var] = -J['B_on_coil', var]
 
 
 class InnerTFCoilStrain(om.ExplicitComponent):
@@ -310,14 +329,15 @@ class InnerTFCoilStrain(om.ExplicitComponent):
                         desc='Fraction of maximum stress on the HTS cable')
 
     def compute(self, inputs, outputs):
-        A_s = inputs['A_s']
-        A_m = inputs['A_m']
-        A_t = inputs['A_t']
-        σ_hts_max = inputs['hts_max_stress']
-        f_HTS = inputs['f_HTS']
-        T1 = inputs['T1']
-        struct_E_y = inputs['struct_E_young']
-        hts_E_y = inputs['hts_E_young']
+        # NumPy scalars, as in InnerTFCoilTension.compute
+        A_s = inputs['A_s'][0]
+        A_m = inputs['A_m'][0]
+        A_t = inputs['A_t'][0]
+        σ_hts_max = inputs['hts_max_stress'][0]
+        f_HTS = inputs['f_HTS'][0]
+        T1 = inputs['T1'][0]
+        struct_E_y = inputs['struct_E_young'][0]
+        hts_E_y = inputs['hts_E_young'][0]
         E_rat = struct_E_y / hts_E_y
 
         sigma_HTS = T1 / ((A_s + A_t) * E_rat + f_HTS * A_m)
@@ -345,30 +365,29 @@ class InnerTFCoilStrain(om.ExplicitComponent):
         hts_E_y = inputs['hts_E_young']
         E_rat = struct_E_y / hts_E_y
 
-        denom = ((A_s + A_t) * E_rat + f_HTS * A_m)
-        J['s_HTS', 'T1'] = 1 / denom
-        J['s_HTS', 'A_s'] = -E_rat * T1 / denom**2
+        A_st = A_s + A_t
+        inv_denom = 1 / (A_st * E_rat + f_HTS * A_m)
+        sigma_HTS = T1 * inv_denom
+        # derivative of s_HTS with respect to the denominator
+        ds_dd = -sigma_HTS * inv_denom
+
+        J['s_HTS', 'T1'] = inv_denom
+        J['s_HTS', 'A_s'] = E_rat * ds_dd
         J['s_HTS', 'A_t'] = J['s_HTS', 'A_s']
-        J['s_HTS', 'A_m'] = -f_HTS * T1 / denom**2
-        J['s_HTS', 'f_HTS'] = -A_m * T1 / denom**2
-        J['s_HTS', 'struct_E_young'] = -(A_s + A_t) * T1 / (hts_E_y * denom**2)
-        J['s_HTS',
-          'hts_E_young'] = (A_s + A_t) * struct_E_y * T1 / (hts_E_y**2 *
-                                                            denom**2)
-
-        J['constraint_max_stress', 'T1'] = -1 / (denom * σ_hts_max)
-        J['constraint_max_stress', 'A_s'] = -J['s_HTS', 'A_s'] / σ_hts_max
-        J['constraint_max_stress', 'A_t'] = -J['s_HTS', 'A_t'] / σ_hts_max
-        J['constraint_max_stress', 'A_m'] = -J['s_HTS', 'A_m'] / σ_hts_max
-        J['constraint_max_stress', 'f_HTS'] = -J['s_HTS', 'f_HTS'] / σ_hts_max
-        J['constraint_max_stress',
-          'hts_max_stress'] = T1 / (denom * σ_hts_max**2)
-        J['constraint_max_stress',
-          'struct_E_young'] = (A_s + A_t) * T1 / (hts_E_y * denom**2 *
-                                                  σ_hts_max)
+        J['s_HTS', 'A_m'] = f_HTS * ds_dd
+        J['s_HTS', 'f_HTS'] = A_m * ds_dd
+        J['s_HTS', 'struct_E_young'] = A_st * ds_dd / hts_E_y
+        J['s_HTS', 'hts_E_young'] = -E_rat * J['s_HTS', 'struct_E_young']
+
+        # the constraint is 1 - s_HTS / σ_hts_max
+        inv_σ_max = 1 / σ_hts_max
+        for var in [
+                'T1', 'A_s', 'A_t', 'A_m', 'f_HTS', 'struct_E_young',
+                'hts_E_young'
+        ]:
+            J['constraint_max_stress', var] = -J['s_HTS', var] * inv_σ_max
         J['constraint_max_stress',
-          'hts_E_young'] = -(A_s + A_t) * struct_E_y * T1 / (
-              hts_E_y**2 * denom**2 * σ_hts_max)
+          'hts_max_stress'] = sigma_HTS * inv_σ_max**2
 
 
 class InboardMagnetGeometry(om.ExplicitComponent):
@@ -561,6 +580,23 @@ class InboardMagnetGeometry(om.ExplicitComponent):
                         units='m**2',
                         desc="Cross section as if magnet were rectangular")
 
+    def _half_angle_trig(self, n_coil):
+        """cos(π / n) and sin(π / n) for the trapezoid half-angle
+
+        n_coil rarely changes during a run, so the pair is kept and reused
+        until it does.
+        """
+        cache = getattr(self, "_half_angle_cache", None)
+        if cache is not None and cache[0] == n_coil[0]:
+            return cache[1]
+        if self.under_complex_step:
+            ang = np.pi / n_coil
+            return (np.cos(ang), np.sin(ang))
+        ang = math.pi / n_coil[0]
+        trig = (math.cos(ang), math.sin(ang))
+        self._half_angle_cache = (n_coil[0], trig)
+        return trig
+
     def compute(self, inputs, outputs):
         e_gap = self.e_gap
         Δr_t = self.Δr_t
@@ -585,45 +621,25 @@ class InboardMagnetGeometry(om.ExplicitComponent):
         outputs['r_it'] = r_it
         outputs['r_ot'] = r_ot
 
-        r_to_w = np.cos(np.pi / n_coil)
-        r_to_l = 2 * np.sin(np.pi / n_coil)
-
-        w_is = r_is * r_to_w
-        w_os = r_os * r_to_w
-        w_im = r_im * r_to_w
-        w_om = r_om * r_to_w
-        w_it = r_it * r_to_w
-        w_ot = r_ot * r_to_w
-
-        # outputs['w_is'] = w_is
-        # outputs['w_os'] = w_os
-        # outputs['w_im'] = w_im
-        # outputs['w_om'] = w_om
-        # outputs['w_it'] = w_it
-        # outputs['w_ot'] = w_ot
-
-        l_is = r_is * r_to_l
-        l_os = r_os * r_to_l
-        l_im = r_im * r_to_l
-        l_om = r_om * r_to_l
-        l_it = r_it * r_to_l
-        l_ot = r_ot * r_to_l
-
-        # outputs['l_is'] = l_is
-        # outputs['l_os'] = l_os
-        # outputs['l_im'] = l_im
-        # outputs['l_om'] = l_om
-        # outputs['l_it'] = l_it
-        # outputs['l_ot'] = l_ot
-
-        outputs['A_s'] = (w_os - w_is) * (l_os + l_is) / 2
-        outputs['A_m'] = (w_om - w_im) * (l_om + l_im) / 2
-        outputs['A_t'] = (w_ot - w_it) * (l_ot + l_it) / 2
+        cos_ang, sin_ang = self._half_angle_trig(n_coil)
+        r_to_w = cos_ang
+        r_to_l = 2 * sin_ang
+
+        # radii ordered (is, os, im, om, it, ot): the inner and outer
+        # edges of each of the three trapezoids in turn
+        r = np.concatenate((r_is, r_os, r_im, r_om, r_it, r_ot))
+        w_vec = r * r_to_w
+        l_vec = r * r_to_l
+
+        A = (w_vec[1::2] - w_vec[0::2]) * (l_vec[1::2] + l_vec[0::2]) / 2
+        outputs['A_s'] = A[0]
+        outputs['A_m'] = A[1]
+        outputs['A_t'] = A[2]
 
         outputs['r1'] = r_im + Δr_m / 2
         outputs["Δr"] = r_ot - r_is
 
-        outputs['approximate cross section'] = (r_ot - r_is) * l_ot
+        outputs['approximate cross section'] = (r_ot - r_is) * l_vec[5]
 
     def setup_partials(self):
         self.declare_partials(['r_os', 'r_im'], ['r_is', 'Δr_s'], val=1)
@@ -631,13 +647,10 @@ class InboardMagnetGeometry(om.ExplicitComponent):
                               ['r_is', 'Δr_s', 'Δr_m'],
                               val=1)
 
-        self.declare_partials('A_s', ['r_is', 'Δr_s'], method="exact")
-        self.declare_partials(['A_m'], ['r_is', 'Δr_s', 'Δr_m'],
-                              method="exact")
-        self.declare_partials(['A_t'], ['r_is', 'Δr_s', 'Δr_m'], method="cs")
+        self.declare_partials('A_s', ['r_is', 'Δr_s'])
+        self.declare_partials(['A_m', 'A_t'], ['r_is', 'Δr_s', 'Δr_m'])
         self.declare_partials(
-            ["A_m", "A_t", "A_s", "approximate cross section"], ["n_coil"],
-            method="cs")
+            ["A_m", "A_t", "A_s", "approximate cross section"], ["n_coil"])
 
         self.declare_partials('r1', ['r_is', 'Δr_s'], val=1)
         self.declare_partials('r1', ['Δr_m'], val=1 / 2)
@@ -645,21 +658,50 @@ class InboardMagnetGeometry(om.ExplicitComponent):
         self.declare_partials('Δr', ['Δr_s', 'Δr_m'], val=1)
 
         self.declare_partials('approximate cross section',
-                              ['Δr_s', 'Δr_m', 'r_is'],
-                              method="cs")
+                              ['Δr_s', 'Δr_m', 'r_is'])
 
     def compute_partials(self, inputs, J):
+        e_gap = self.e_gap
+        Δr_t = self.Δr_t
+
         r_is = inputs['r_is']
         Δr_s = inputs['Δr_s']
         Δr_m = inputs['Δr_m']
         n_coil = inputs['n_coil']
-        sin2ang = np.sin(2 * np.pi / n_coil)
+
+        r_os = r_is + Δr_s
+        r_im = r_os + e_gap
+        r_om = r_im + Δr_m
+        r_it = r_om + e_gap
+        r_ot = r_it + Δr_t
+
+        # each area is sin(2 π / n) (r_outer² - r_inner²) / 2
+        ang = np.pi / n_coil
+        cos_ang, sin_ang = self._half_angle_trig(n_coil)
+        sin2ang = 2 * sin_ang * cos_ang
+        dsin2ang_dn = -2 * ang * (cos_ang**2 - sin_ang**2) / n_coil
+
         J["A_s", "r_is"] = Δr_s * sin2ang
         J["A_s", "Δr_s"] = (r_is + Δr_s) * sin2ang
         J["A_m", "r_is"] = Δr_m * sin2ang
         J["A_m", "Δr_s"] = Δr_m * sin2ang
-        J["A_m", "Δr_m"] = (r_is + Δr_s + self.e_gap + Δr_m) * sin2ang
-        # construction of the analytic derivatives is incomplete here.
+        J["A_m", "Δr_m"] = (r_is + Δr_s + e_gap + Δr_m) * sin2ang
+        J["A_t", "r_is"] = Δr_t * sin2ang
+        J["A_t", "Δr_s"] = Δr_t * sin2ang
+        J["A_t", "Δr_m"] = Δr_t * sin2ang
+
+        J["A_s", "n_coil"] = (r_os**2 - r_is**2) / 2 * dsin2ang_dn
+        J["A_m", "n_coil"] = (r_om**2 - r_im**2) / 2 * dsin2ang_dn
+        J["A_t", "n_coil"] = (r_ot**2 - r_it**2) / 2 * dsin2ang_dn
+
+        # the approximate cross section is (r_ot - r_is) r_ot 2 sin(π / n)
+        r_to_l = 2 * sin_ang
+        dr_to_l_dn = -2 * ang * cos_ang / n_coil
+        Δr = r_ot - r_is
+        J["approximate cross section", "r_is"] = Δr * r_to_l
+        J["approximate cross section", "Δr_s"] = (Δr + r_ot) * r_to_l
+        J["approximate cross section", "Δr_m"] = (Δr + r_ot) * r_to_l
+        J["approximate cross section", "n_coil"] = Δr * r_ot * dr_to_l_dn
 
 
 class OutboardMagnetGeometry(om.ExplicitComponent):
@@ -738,14 +780,17 @@ class MagnetCurrent(om.ExplicitComponent):
         Fraction of that winding pack which is superconducting cable
     j_HTS : float
         MA/m^2, Current density in that superconducting cable
+    j_eff_wp_max : float
+        MA/m^2, Maximum average current density in the winding pack
 
     Outputs
     -------
     I_leg : float
         MA: Current in one TF leg
-    j_eff_wp_max : float
-        MA/m^2 : maximum current density in the superconducting cable
-
+    constraint_wp_current_density : float
+        Positive when the winding pack current density is lower than the
+        limit. The magnitude is as if it were specified in MA, but the
+        quantity is unitless.
     """
     def setup(self):
         self.add_input('A_m',
@@ -757,17 +802,28 @@ class MagnetCurrent(om.ExplicitComponent):
         self.add_input('j_HTS',
                        units='MA/m**2',
                        desc="Current density in superconducting cable")
+        self.add_input('j_eff_wp_max',
+                       units='MA/m**2',
+                       desc="Winding pack average current density")
         self.add_output('I_leg', units='MA', desc="Current in one TF leg")
+        self.add_output('constraint_wp_current_density',
+                        desc="Positive if acceptable")
 
     def compute(self, inputs, outputs):
-        A_m = inputs['A_m']
-        f_HTS = inputs['f_HTS']
-        j_HTS = inputs['j_HTS']
+        # NumPy scalars, as in InnerTFCoilTension.compute
+        A_m = inputs['A_m'][0]
+        f_HTS = inputs['f_HTS'][0]
+        j_HTS = inputs['j_HTS'][0]
         i_leg = A_m * f_HTS * j_HTS
         outputs['I_leg'] = i_leg
+        outputs['constraint_wp_current_density'] = (
+            A_m * inputs['j_eff_wp_max'][0] - i_leg)
 
     def setup_partials(self):
-        self.declare_partials('I_leg', ['A_m', 'f_HTS', 'j_HTS'])
+        self.declare_partials(['I_leg', 'constraint_wp_current_density'],
+                              ['A_m', 'f_HTS', 'j_HTS'])
+        self.declare_partials('constraint_wp_current_density',
+                              'j_eff_wp_max')
 
     def compute_partials(self, inputs, J):
         A_m = inputs['A_m']
@@ -777,6 +833,12 @@ class MagnetCurrent(om.ExplicitComponent):
         J['I_leg', 'f_HTS'] = A_m * j_HTS
         J['I_leg', 'j_HTS'] = A_m * f_HTS
 
+        J['constraint_wp_current_density', 'A_m'] = (inputs['j_eff_wp_max'] -
+                                                     f_HTS * j_HTS)
+        J['constraint_wp_current_density', 'f_HTS'] = -J['I_leg', 'f_HTS']
+        J['constraint_wp_current_density', 'j_HTS'] = -J['I_leg', 'j_HTS']
+        J['constraint_wp_current_density', 'j_eff_wp_max'] = A_m
+
 
 class SimpleMagnetEngineering(om.Group):
     r"""Determines magnetic field strength & constraint values
@@ -814,12 +876,12 @@ class SimpleMagnetEngineering(om.Group):
         MA, Current per magnet leg
            As if the magnet is a 'single-turn' coil
 
-    con_cmp2.constraint_B_on_coil: float
+    constraint_B_on_coil: float
         A value which is positive when the B on coil is lower than the
            maximum B on coil. The magnitude is as if it were specified in
            Teslas, though the quantity is unitless.
 
-    con_cmp3.constraint_wp_current_density : float
+    constraint_wp_current_density : float
         A value which is positive when the winding pack current density is
         lower than the limit. The magnitude is as if it were specified in MA,
         but the quantity is unitless.
@@ -839,17 +901,21 @@ class SimpleMagnetEngineering(om.Group):
                            promotes_outputs=['f_HTS', 'B_max'])
         self.add_subsystem('magnetstructure_props',
                            MagnetStructureProperties(config=config))
-        self.add_subsystem('current',
-                           MagnetCurrent(),
-                           promotes_inputs=['A_m', 'f_HTS', 'j_HTS'],
-                           promotes_outputs=['I_leg'])
+        self.add_subsystem(
+            'current',
+            MagnetCurrent(),
+            promotes_inputs=['A_m', 'f_HTS', 'j_HTS'],
+            promotes_outputs=['I_leg', 'constraint_wp_current_density'])
+        self.connect('windingpack.j_eff_max', ['current.j_eff_wp_max'])
         self.add_subsystem('field',
                            FieldAtRadius(),
                            promotes_inputs=[
                                'I_leg', ('r_om', "Ib winding pack R_out"),
-                               'R0', 'n_coil'
+                               'R0', 'n_coil', 'B_max'
                            ],
-                           promotes_outputs=['B_on_coil', 'B0'])
+                           promotes_outputs=[
+                               'B_on_coil', 'B0', 'constraint_B_on_coil'
+                           ])
         self.add_subsystem(
             'tension',
             InnerTFCoilTension(),
@@ -866,44 +932,6 @@ class SimpleMagnetEngineering(om.Group):
         self.connect('windingpack.max_stress', ['strain.hts_max_stress'])
         self.connect("windingpack.Young's modulus", ['strain.hts_E_young'])
 
-        # Subsystems with outputs that can be used as constraints
-        self.add_subsystem(
-            'con_cmp2',
-            om.ExecComp('constraint_B_on_coil = B_max - B_on_coil',
-                        constraint_B_on_coil={
-                            'desc': "Positive if acceptable field-on-coil"
-                        },
-                        B_on_coil={
-                            'units': 'T',
-                            'desc': "Computed field on coil"
-                        },
-                        B_max={
-                            'units': 'T',
-                            'desc': "Max allowable field on coil"
-                        }),
-            promotes=['constraint_B_on_coil', 'B_on_coil', 'B_max'])
-        self.add_subsystem(
-            'con_cmp3',
-            om.ExecComp(
-                'constraint_wp_current_density = A_m * j_eff_wp_max - I_leg',
-                constraint_wp_current_density={
-                    'desc': "Positive if acceptable"
-                },
-                A_m={
-                    'units': 'm**2',
-                    'desc': "Winding pack cross section"
-                },
-                j_eff_wp_max={
-                    'units': 'MA/m**2',
-                    'desc': "Winding pack average current density"
-                },
-                I_leg={
-                    'units': 'MA',
-                    'desc': "Current in magnet leg"
-                }),
-            promotes=['constraint_wp_current_density', 'A_m', 'I_leg'])
-        self.connect('windingpack.j_eff_max', ['con_cmp3.j_eff_wp_max'])
-
 
 class ExampleMagnetRadialBuild(om.Group):
     r"""This is a class for testing and demonstration.
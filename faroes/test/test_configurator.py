@@ -593,6 +593,18 @@ class TestUpdateConfigurationLoading(unittest.TestCase):
         res = self.f(('magnet_geometry', 'inter-block clearance'), 'mm')
         assert_near_equal(res, 2)
 
+    def test_update_after_get(self):
+        with resources.path(self.resource_dir,
+                            'config_okay_units.yaml') as path:
+            self.uc = UserConfigurator(path)
+        self.f = self.uc.get_value
+        res = self.f(('magnet_geometry', 'inter-block clearance'), 'mm')
+        assert_near_equal(res, 1)
+        with resources.path(self.resource_dir, 'config.yaml') as path:
+            self.uc.update_configuration(path)
+        res = self.f(('magnet_geometry', 'inter-block clearance'), 'mm')
+        assert_near_equal(res, 2)
+
 
 if __name__ == '__main__':
     unittest.main()
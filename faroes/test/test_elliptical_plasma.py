@@ -89,6 +89,9 @@ class TestEllipticalPlasmaGeometry(unittest.TestCase):
         S_c = prob.get_val("S_c", units="m**2")
         expected = 30
         assert_near_equal(S_c, expected, tolerance=1e-2)
+        κ = prob.get_val("κ")
+        κa = prob.get_val("κa")
+        assert_near_equal(κa, κ, tolerance=1e-12)
 
 
 if __name__ == '__main__':
@@ -11,6 +11,20 @@ from openmdao.utils.assert_utils import assert_near_equal
 import unittest
 
 
+class SetupProblemMixin:
+    """Sets up self.prob with complex vectors only when they are needed
+
+    setUp builds self.prob and set_inputs sets the input values.
+    test_partials asks for complex vectors, for the cs partials check;
+    test_value does not.
+    """
+    def setup_problem(self, force_alloc_complex=False):
+        prob = self.prob
+        prob.setup(force_alloc_complex=force_alloc_complex)
+        self.set_inputs(prob)
+        return prob
+
+
 class TestCriticalSlowingEnergyRatio(unittest.TestCase):
     def setUp(self):
         prob = om.Problem()
@@ -25,103 +39,102 @@ class TestCriticalSlowingEnergyRatio(unittest.TestCase):
         assert_check_partials(check)
 
 
-class TestFastParticleHeatingFractions(unittest.TestCase):
+class TestFastParticleHeatingFractions(SetupProblemMixin, unittest.TestCase):
     def setUp(self):
         prob = om.Problem()
 
         prob.model = fps.FastParticleHeatingFractions()
+        self.prob = prob
 
-        prob.setup(force_alloc_complex=True)
-
+    def set_inputs(self, prob):
         prob.set_val('W/Wc', 1.0)
-        self.prob = prob
 
     def test_partials(self):
-        prob = self.prob
+        prob = self.setup_problem(force_alloc_complex=True)
         prob.run_driver()
         check = prob.check_partials(out_stream=None, method='cs')
         assert_check_partials(check)
 
     def test_value(self):
-        prob = self.prob
+        prob = self.setup_problem()
         prob.run_driver()
         expected = (2 / 9) * (3**(1 / 2) * np.pi - 3 * np.log(2))
         assert_near_equal(prob["f_i"], expected, tolerance=1e-5)
 
 
-class TestSlowingTimeOnElectrons(unittest.TestCase):
+class TestSlowingTimeOnElectrons(SetupProblemMixin, unittest.TestCase):
     def setUp(self):
         prob = om.Problem()
         prob.model = fps.SlowingTimeOnElectrons()
-        prob.setup(force_alloc_complex=True)
+        self.prob = prob
 
+    def set_inputs(self, prob):
         prob.set_val("At", 2, units='u')
         prob.set_val("Zt", 1)
         prob.set_val("ne", 1.06e20, units='m**-3')
         prob.set_val("Te", 9.20, units='keV')
         prob.set_val("logΛe", 17.37)
 
-        self.prob = prob
-
     def test_partials(self):
-        prob = self.prob
+        prob = self.setup_problem(force_alloc_complex=True)
         check = prob.check_partials(out_stream=None, method='cs')
         assert_check_partials(check)
 
     def test_value(self):
-        prob = self.prob
+        prob = self.setup_problem()
         prob.run_driver()
         expected = 0.599  # seconds
         assert_near_equal(prob["ts"], expected, tolerance=1e-2)
 
 
-class TestSlowingThermalizationTime(unittest.TestCase):
+class TestSlowingThermalizationTime(SetupProblemMixin, unittest.TestCase):
     def setUp(self):
         prob = om.Problem()
 
         prob.model = fps.SlowingThermalizationTime()
+        self.prob = prob
 
-        prob.setup(force_alloc_complex=True)
-
+    def set_inputs(self, prob):
         prob.set_val('W/Wc', 1.0)
         prob.set_val('ts', 1.0)
-        self.prob = prob
 
     def test_partials(self):
-        prob = self.prob
+        prob = self.setup_problem(force_alloc_complex=True)
         check = prob.check_partials(out_stream=None, method='cs')
         assert_check_partials(check)
 
     def test_value(self):
-        prob = self.prob
+        prob = self.setup_problem()
         prob.run_driver()
         assert_near_equal(prob["τth"], 0.231049, tolerance=1e-5)
 
 
-class TestAverageEnergyWhileSlowing(unittest.TestCase):
+class TestAverageEnergyWhileSlowing(SetupProblemMixin, unittest.TestCase):
     def setUp(self):
         prob = om.Problem()
         prob.model = fps.AverageEnergyWhileSlowing()
-        prob.setup(force_alloc_complex=True)
+        self.prob = prob
 
+    def set_inputs(self, prob):
         prob.set_val('W/Wc', 1.0)
         prob.set_val('Wc', 2.0, units='keV')
-        self.prob = prob
 
     def test_partials(self):
-        prob = self.prob
+        prob = self.setup_problem(force_alloc_complex=True)
         check = prob.check_partials(out_stream=None, method='cs')
         assert_check_partials(check)
 
     def test_value(self):
-        prob = self.prob
+        prob = self.setup_problem()
         prob.run_driver()
         expected = (9 - 2 * 3**(1 / 2) * pi + np.log(64)) / np.log(8)
         assert_near_equal(prob["Wbar"], expected, tolerance=1e-5)
 
 
 class TestFastParticleSlowing(unittest.TestCase):
-    def setUp(self):
+    # the model is only evaluated, never modified, by these tests
+    @classmethod
+    def setUpClass(cls):
         prob = om.Problem()
         uc = UserConfigurator()
 
@@ -147,7 +160,7 @@ class TestFastParticleSlowing(unittest.TestCase):
         prob.set_val("Te", 9.20, units='keV')
         prob.set_val("logΛe", 17.37)
         prob.set_val('Wt', 500, units='keV')
-        self.prob = prob
+        cls.prob = prob
 
     def test_slowing_time_value(self):
         prob = self.prob
@@ -163,7 +176,7 @@ class TestFastParticleSlowing(unittest.TestCase):
         assert_near_equal(prob["fps.Wbar"], expectedWbar, tolerance=1e-3)
 
 
-class TestStixCriticalSlowingEnergy(unittest.TestCase):
+class TestStixCriticalSlowingEnergy(SetupProblemMixin, unittest.TestCase):
     def setUp(self):
         prob = om.Problem()
 
@@ -175,8 +188,9 @@ class TestStixCriticalSlowingEnergy(unittest.TestCase):
         prob.model.add_subsystem('cse',
                                  fps.StixCriticalSlowingEnergy(),
                                  promotes_inputs=["*"])
+        self.prob = prob
 
-        prob.setup(force_alloc_complex=True)
+    def set_inputs(self, prob):
         prob.set_val("At", 2, units='u')
         prob.set_val("ne", 1.0629e20, units='m**-3')
         prob.set_val("Te", 9.20, units='keV')
@@ -185,21 +199,20 @@ class TestStixCriticalSlowingEnergy(unittest.TestCase):
                      units='m**-3')
         prob.set_val("Ai", [2, 3, 12], units='u')
         prob.set_val("Zi", [1, 1, 6])
-        self.prob = prob
 
     def test_partials(self):
-        prob = self.prob
+        prob = self.setup_problem(force_alloc_complex=True)
         check = prob.check_partials(out_stream=None, method='cs')
         assert_check_partials(check)
 
     def test_value(self):
-        prob = self.prob
+        prob = self.setup_problem()
         prob.run_driver()
         expected = 155.5
         assert_near_equal(prob["cse.W_crit"], expected, tolerance=1e-3)
 
 
-class TestBellanCriticalSlowingEnergy(unittest.TestCase):
+class TestBellanCriticalSlowingEnergy(SetupProblemMixin, unittest.TestCase):
     def setUp(self):
         prob = om.Problem()
 
@@ -211,24 +224,23 @@ class TestBellanCriticalSlowingEnergy(unittest.TestCase):
         prob.model.add_subsystem('cse',
                                  fps.BellanCriticalSlowingEnergy(),
                                  promotes_inputs=["*"])
+        self.prob = prob
 
-        prob.setup(force_alloc_complex=True)
-
+    def set_inputs(self, prob):
         prob.set_val("At", 2, units='u')
         prob.set_val("ne", 1.0e20, units='m**-3')
         prob.set_val("Te", 1.0, units='keV')
         prob.set_val("ni", np.array([0.5e20, 0.5e20]), units='m**-3')
         prob.set_val("Ai", [2, 3], units='u')
         prob.set_val("Zi", [1, 1])
-        self.prob = prob
 
     def test_partials(self):
-        prob = self.prob
+        prob = self.setup_problem(force_alloc_complex=True)
         check = prob.check_partials(out_stream=None, method='cs')
         assert_check_partials(check)
 
     def test_value(self):
-        prob = self.prob
+        prob = self.setup_problem()
         prob.set_val("At", 2, units='u')
         prob.set_val("ne", 1.06e20, units='m**-3')
         prob.set_val("Te", 9.20, units='keV')
@@ -25,6 +25,13 @@ class TestBetaNComputation(unittest.TestCase):
         check = prob.check_partials(out_stream=None, method='cs')
         assert_check_partials(check)
 
+    def test_partials_after_change(self):
+        prob = self.prob
+        prob.run_model()
+        prob.set_val("A", 2.5)
+        check = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(check)
+
     def test_value(self):
         prob = self.prob
         prob.run_driver()
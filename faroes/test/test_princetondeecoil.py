@@ -8,15 +8,17 @@ from scipy.constants import pi
 
 import unittest
 
+# shared poloidal angle grid; read-only so no test can change it
+_THETA = np.linspace(-pi, pi, 31, endpoint=True)
+_THETA.flags.writeable = False
+
 
 class TestPrincetonDeeTFSet(unittest.TestCase):
     def setUp(self):
         prob = om.Problem()
 
-        θ = np.linspace(-pi, pi, 31, endpoint=True)
-
         prob.model.add_subsystem("ivc",
-                                 om.IndepVarComp("θ", val=θ),
+                                 om.IndepVarComp("θ", val=_THETA),
                                  promotes_outputs=["*"])
 
         prob.model.add_subsystem("tadTF",
@@ -28,7 +30,7 @@ class TestPrincetonDeeTFSet(unittest.TestCase):
         prob.set_val("R0", 2)
         prob.set_val("Ib TF R_out", 1)
         prob.set_val("Ob TF R_in", 3)
-        prob.set_val("θ", θ)
+        prob.set_val("θ", _THETA)
 
         self.prob = prob
 
@@ -3,6 +3,7 @@ import faroes.sauter_plasma as plasma
 
 import openmdao.api as om
 from openmdao.utils.assert_utils import assert_check_partials
+from openmdao.utils.assert_utils import assert_near_equal
 
 import numpy as np
 
@@ -38,6 +39,47 @@ class TestSauterGeometry(unittest.TestCase):
                                     form='central')
         assert_check_partials(check, atol=5e-3, rtol=1e-5)
 
+    def test_R02_partials(self):
+        prob = self.prob
+        check = prob.check_partials(out_stream=None,
+                                    method='fd',
+                                    form='central',
+                                    step=1e-5)["geom"]
+        for of in ["<(R0/R)^2>", "<(R0/R)^2>n"]:
+            for wrt in ["A", "δ", "ξ"]:
+                partials = check[of, wrt]
+                assert_near_equal(partials["J_fwd"],
+                                  partials["J_fd"],
+                                  tolerance=1e-6)
+
+    def test_new_θ(self):
+        prob = self.prob
+        prob.run_model()
+        θ = np.linspace(0, np.pi, 7)
+        prob.set_val("θ", θ)
+        prob.run_model()
+        R = prob.get_val("geom.R", units="m")
+        expected = 3 + 1.875 * np.cos(θ + 0.5 * np.sin(θ) -
+                                      0.3 * np.sin(2 * θ))
+        assert_near_equal(R, expected, tolerance=1e-12)
+
+    def test_boundary(self):
+        prob = self.prob
+        prob.run_model()
+        θ = prob.get_val("θ")
+        R, Z = plasma.SauterGeometry.boundary(3, 1.875, 2.7, 0.5, 0.3, θ)
+        assert_near_equal(R, prob.get_val("geom.R"), tolerance=1e-12)
+        assert_near_equal(Z, prob.get_val("geom.Z"), tolerance=1e-12)
+
+        R, Z = plasma.SauterGeometry.boundary(np.array([3, 4]),
+                                              np.array([1.875, 1]),
+                                              np.array([2.7, 2]),
+                                              np.array([0.5, 0]),
+                                              np.array([0.3, 0]), θ)
+        self.assertEqual(R.shape, (2, len(θ)))
+        assert_near_equal(R[0], prob.get_val("geom.R"), tolerance=1e-12)
+        assert_near_equal(Z[1], 2 * np.sin(θ), tolerance=1e-12)
+
 
 if __name__ == '__main__':
     unittest.main()
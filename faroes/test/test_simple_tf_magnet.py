@@ -1,4 +1,5 @@
 import openmdao.api as om
+import numpy as np
 from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.assert_utils import assert_check_partials
 import unittest
@@ -93,9 +94,8 @@ class TestFieldAtRadius(unittest.TestCase):
         assert_near_equal(prob['B0'][0], 1, 1e-4)
         assert_near_equal(prob['B_on_coil'][0], 2, 1e-4)
 
-        # Here fd is used to check because the derivatives wrt n_coil are cs.
-        check = prob.check_partials(out_stream=None, method='fd')
-        assert_check_partials(check, rtol=2e-6, atol=3e-6)
+        check = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(check)
 
 
 class TestInboardMagnetGeometry(unittest.TestCase):
@@ -115,9 +115,18 @@ class TestInboardMagnetGeometry(unittest.TestCase):
     def test_partials(self):
         prob = self.prob
 
-        # once converted to exact derivatives, these could be checked via cs.
-        check = prob.check_partials(out_stream=None, method='fd')
-        assert_check_partials(check, rtol=2e-6)
+        check = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(check)
+
+    def test_n_coil_change(self):
+        prob = self.prob
+        A_s_18 = prob.get_val('A_s')[0]
+        prob['n_coil'] = 12
+        prob.run_driver()
+        A_s_12 = prob.get_val('A_s')[0]
+        # the area scales as sin(2 π / n)
+        assert_near_equal(A_s_12 / A_s_18,
+                          np.sin(np.pi / 6) / np.sin(np.pi / 9), 1e-12)
 
 
 class TestOutboardMagnetGeometry(unittest.TestCase):
@@ -153,6 +162,24 @@ class TestMagnetCurrent(unittest.TestCase):
         assert_check_partials(check)
 
 
+class TestInnerTFCoilTension(unittest.TestCase):
+    def test_partials(self):
+        prob = om.Problem()
+
+        prob.model = magnet.InnerTFCoilTension()
+        prob.setup(force_alloc_complex=True)
+
+        prob['I_leg'] = 10 * example_value_1
+        prob['B0'] = 20 * example_value_2
+        prob['R0'] = 3
+        prob['r1'] = 2 * example_value_3
+        prob['r2'] = 8 + example_value_1
+        prob.run_model()
+
+        check = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(check)
+
+
 class TestInnerTFCoilStrain(unittest.TestCase):
     def test_partials(self):
         prob = om.Problem()
@@ -349,6 +349,48 @@ class TestSoftmax(unittest.TestCase):
         assert_near_equal(z, expected, tolerance=1e-6)
 
 
+class TestDifferenceKS(unittest.TestCase):
+    def setUp(self):
+        a = [3.0, 2.5, 4.0, 6.0]
+        b = [1.0, 2.0, 1.5, 0.5]
+
+        u = "m**2"
+        prob = om.Problem()
+        ivc = om.IndepVarComp()
+        ivc.add_output("a", val=a, units=u)
+        ivc.add_output("b", val=b, units=u)
+        prob.model.add_subsystem("ivc", ivc, promotes_outputs=["*"])
+        prob.model.add_subsystem("dks",
+                                 util.DifferenceKS(units=u, rho=10),
+                                 promotes_inputs=["*"])
+        ks = om.KSComp(width=4, units=u, rho=10, lower_flag=True)
+        prob.model.add_subsystem("margin",
+                                 om.ExecComp("c = a - b",
+                                             a={"units": u, "shape": 4},
+                                             b={"units": u, "shape": 4},
+                                             c={"units": u, "shape": 4}),
+                                 promotes_inputs=["*"])
+        prob.model.add_subsystem("ks", ks)
+        prob.model.connect("margin.c", "ks.g")
+
+        prob.setup(force_alloc_complex=True)
+        self.prob = prob
+
+    def test_partials(self):
+        prob = self.prob
+        check = prob.check_partials(out_stream=None,
+                                    method='cs',
+                                    includes=["dks"])
+        assert_check_partials(check)
+
+    def test_values(self):
+        prob = self.prob
+        prob.run_driver()
+        assert_near_equal(prob.get_val("dks.KS"),
+                          prob.get_val("ks.KS")[0],
+                          tolerance=1e-12)
+
+
 class TestPolygonalTorusVolume(unittest.TestCase):
     def setUp(self):
         x = [2, 2, 1, 1]
@@ -378,6 +420,35 @@ class TestPolygonalTorusVolume(unittest.TestCase):
         assert_near_equal(V, expected, tolerance=1e-8)
 
 
+class TestTorusDerivatives(unittest.TestCase):
+    def check_derivatives(self, f, df, args):
+        h = 1e-6
+        exact = df(*args)
+        for i, key in enumerate(["R", "a", "b"][:len(args)]):
+            argp = list(args)
+            argn = list(args)
+            argp[i] += h
+            argn[i] -= h
+            approx = (f(*argp) - f(*argn)) / (2 * h)
+            assert_near_equal(exact[key], approx, tolerance=1e-6)
+        self.assertEqual(len(exact), len(args))
+
+    def test_surface_area(self):
+        self.check_derivatives(util.torus_surface_area,
+                               util.torus_surface_area_derivatives,
+                               (3.0, 1.2))
+        self.check_derivatives(util.torus_surface_area,
+                               util.torus_surface_area_derivatives,
+                               (3.0, 1.2, 2.1))
+
+    def test_volume(self):
+        self.check_derivatives(util.torus_volume,
+                               util.torus_volume_derivatives, (3.0, 1.2))
+        self.check_derivatives(util.torus_volume,
+                               util.torus_volume_derivatives,
+                               (3.0, 1.2, 2.1))
+
+
 class TestPolarOffsetEllipseRadiusDerivatives(unittest.TestCase):
     def setUp(self):
         self.a = 2
@@ -416,6 +487,113 @@ class TestPolarOffsetEllipseRadiusDerivatives(unittest.TestCase):
         exact = util.polar_offset_ellipse_radius_dy(a, b, x, y, t)
         assert(np.allclose(cd, exact))
 
+    def test_values_dt(self):
+        a = self.a
+        b = self.b
+        x = self.x
+        y = self.y
+        t = self.t
+        dt = self.dx
+
+        ansp1 = util.polar_offset_ellipse(a, b, x, y, t + dt)
+        ansn1 = util.polar_offset_ellipse(a, b, x, y, t - dt)
+        cd = (ansp1 - ansn1) / (2*dt)
+        exact = util.polar_offset_ellipse_radius_dt(a, b, x, y, t)
+        assert(np.allclose(cd, exact))
+
+
+class TestRZIntegrators(unittest.TestCase):
+    def setUp(self):
+        t = np.linspace(0, 2 * np.pi, 400, endpoint=False)
+        self.R = 3 + 1 * np.cos(t)
+        self.Z = 2 * np.sin(t)
+
+    def test_cross_section_area(self):
+        A = util.cross_section_area_RZ(self.R, self.Z)
+        assert_near_equal(A, np.pi * 1 * 2, tolerance=1e-3)
+
+    def test_volume(self):
+        V = util.volume_RZ(self.R, self.Z)
+        assert_near_equal(V, util.torus_volume(3, 1, 2), tolerance=1e-3)
+
+    def test_surface_area(self):
+        S = util.surface_area_RZ(self.R, self.Z)
+        expected = util.torus_surface_area(3, 1, 2)
+        assert_near_equal(S, expected, tolerance=1e-2)
+
+    def check_derivatives(self, f, f_derivatives):
+        t = np.linspace(0, 2 * np.pi, 37, endpoint=False) + 0.05
+        R = 3 + np.cos(t + 0.3 * np.sin(t))
+        Z = 2 * np.sin(t)
+        nx = 300
+        h = 1e-6
+        d = f_derivatives(R, Z, nx)
+        for i in range(len(t)):
+            e = np.zeros(len(t))
+            e[i] = h
+            dR = (f(R + e, Z, nx) - f(R - e, Z, nx)) / (2 * h)
+            dZ = (f(R, Z + e, nx) - f(R, Z - e, nx)) / (2 * h)
+            assert_near_equal(d["R"][i], dR, tolerance=1e-5)
+            assert_near_equal(d["Z"][i], dZ, tolerance=1e-5)
+
+    def test_volume_derivatives(self):
+        self.check_derivatives(util.volume_RZ, util.volume_RZ_derivatives)
+
+    def test_surface_area_derivatives(self):
+        self.check_derivatives(util.surface_area_RZ,
+                               util.surface_area_RZ_derivatives)
+
+    def test_modified_in_place(self):
+        R, Z = self.R.copy(), self.Z.copy()
+        util.cross_section_area_RZ(R, Z)
+        Z *= 2
+        A = util.cross_section_area_RZ(R, Z)
+        assert_near_equal(A, np.pi * 1 * 4, tolerance=1e-3)
+
+    def test_complex_step(self):
+        t = np.linspace(0, 2 * np.pi, 37, endpoint=False) + 0.05
+        R = 3 + np.cos(t + 0.3 * np.sin(t))
+        Z = 2 * np.sin(t)
+        nx = 300
+        h = 1e-30
+        dR = np.cos(2 * t)
+        dZ = np.sin(3 * t)
+        for f, f_derivatives in [
+            (util.volume_RZ, util.volume_RZ_derivatives),
+            (util.surface_area_RZ, util.surface_area_RZ_derivatives),
+        ]:
+            d = f_derivatives(R, Z, nx)
+            V = f(R, Z + 1j * h * dZ, nx)
+            assert_near_equal(V.real, f(R, Z, nx), tolerance=1e-12)
+            assert_near_equal(V.imag / h, np.dot(d["Z"], dZ), tolerance=1e-8)
+            V = f(R + 1j * h * dR, Z, nx)
+            assert_near_equal(V.imag / h, np.dot(d["R"], dR), tolerance=1e-8)
+
+
+class TestValueAndDerivatives(unittest.TestCase):
+    def test_tube_segment_volume(self):
+        args = (0.3, 0.5, 2.0)
+        V, dV = util.tube_segment_volume_and_derivatives(*args)
+        assert_near_equal(V, util.tube_segment_volume(*args))
+        expected = util.tube_segment_volume_derivatives(*args)
+        for k in expected:
+            assert_near_equal(dV[k], expected[k])
+
+    def test_ellipse_perimeter_ramanujan(self):
+        P, dP = util.ellipse_perimeter_ramanujan_and_derivatives(1.2, 2.7)
+        assert_near_equal(P, util.ellipse_perimeter_ramanujan(1.2, 2.7))
+        expected = util.ellipse_perimeter_ramanujan_derivatives(1.2, 2.7)
+        for k in expected:
+            assert_near_equal(dP[k], expected[k])
+
+
+class TestMostCommonIsotope(unittest.TestCase):
+    def test_neon(self):
+        ne = util.most_common_isotope("Ne")
+        self.assertEqual(ne.mass_number, 20)
+        self.assertEqual(ne.charge_number, 10)
+        self.assertIs(util.most_common_isotope("Ne"), ne)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,6 +6,40 @@ from scipy.constants import pi
 import numpy as np
 
 
+def _dee_segments(θ, R0, r_ot, R, e_b, hhs):
+    """Split the angles around R0 by the part of the Dee they point at
+
+    Parameters
+    ----------
+    θ : array
+        Angles from the point (R0, 0)
+    R0 : float
+        Major radius of the angle origin
+    r_ot : float
+        Radius of the inboard straight leg
+    R : float
+        Radius of the transition from the inboard arcs to the ellipse
+    e_b : float
+        Half-height of the outboard ellipse
+    hhs : float
+        Half-height of the inboard straight leg
+
+    Returns
+    -------
+    on_straight, on_lower_arc, on_upper_arc, on_ellipse : array of bool
+    """
+    θ1 = cs_safe_arctan2(e_b, R - R0)
+    θ2 = cs_safe_arctan2(hhs, r_ot - R0)
+    θ3 = cs_safe_arctan2(-hhs, r_ot - R0)
+    θ4 = cs_safe_arctan2(-e_b, R - R0)
+
+    on_ellipse = (θ4 < θ) * (θ < θ1)
+    on_upper_arc = (θ1 <= θ) * (θ < θ2)
+    on_lower_arc = (θ3 < θ) * (θ <= θ4)
+    on_straight = np.logical_or(θ2 <= θ, θ <= θ3)
+    return on_straight, on_lower_arc, on_upper_arc, on_ellipse
+
+
 class ThreeEllipseArcDeeTFSetAdaptor(om.ExplicitComponent):
     r"""Helps generate feasible ThreeEllipseArcDee solutions
 
@@ -385,6 +419,18 @@ class ThreeEllipseArcDeeTFSet(om.ExplicitComponent):
                         lower=0,
                         desc="Elongation of the elliptical arc")
 
+    def _segments(self, θ, inputs):
+        """Boundary segments that the angles θ point at
+
+        Shared by compute and compute_partials so that the two always
+        agree on the piecewise boundaries.
+        """
+        r_ot = inputs["Ib TF R_out"]
+        R = r_ot + inputs["e1_a"]
+        hhs = inputs["hhs"]
+        e_b = hhs + inputs["e1_b"]
+        return _dee_segments(θ, inputs["R0"], r_ot, R, e_b, hhs)
+
     def compute(self, inputs, outputs):
         size = self._get_var_meta("θ", "size")
         R0 = inputs["R0"]
@@ -415,17 +461,8 @@ class ThreeEllipseArcDeeTFSet(om.ExplicitComponent):
         outputs["V_enc"] = v_1 + v_2 + v_3
         outputs["bore"] = e1_a + e_a
 
-        θ1 = cs_safe_arctan2(e_b, R - R0)
-        θ2 = cs_safe_arctan2(hhs, r_ot - R0)
-        θ3 = cs_safe_arctan2(-hhs, r_ot - R0)
-        θ4 = cs_safe_arctan2(-e_b, R - R0)
-
-        θ = θ_all
-        on_ellipse = (θ4 < θ) * (θ < θ1)
-        on_upper_arc = (θ1 <= θ) * (θ < θ2)
-        on_lower_arc = (θ3 < θ) * (θ <= θ4)
-        on_straight = np.logical_or(θ2 <= θ, θ <= θ3)
-        # abbreviations for easier writing
+        (on_straight, on_lower_arc, on_upper_arc,
+         on_ellipse) = self._segments(θ_all, inputs)
 
         d2 = np.zeros(size, dtype=np.cdouble)
 
@@ -459,7 +496,10 @@ class ThreeEllipseArcDeeTFSet(om.ExplicitComponent):
                               ["Ib TF R_out", "e_a", "hhs", "e1_a", "e1_b"],
                               method="cs")
         self.declare_partials("d_sq", ["R0"], method="cs")
-        self.declare_partials("d_sq", ["θ"], method="cs")
+        size = self._get_var_meta("θ", "size")
+        self.declare_partials("d_sq", ["θ"],
+                              rows=range(size),
+                              cols=range(size))
         self.declare_partials("Ob TF R_in", ["e_a", "e1_a", "Ib TF R_out"],
                               val=1)
         self.declare_partials("constraint_axis_within_coils",
@@ -519,6 +559,29 @@ class ThreeEllipseArcDeeTFSet(om.ExplicitComponent):
         J["e_κ", "e1_b"] = 1 / e_a
         J["e_κ", "e_a"] = -(hhs + e1_b) / e_a**2
 
+        R0 = inputs["R0"]
+        θ_all = inputs["θ"]
+        (on_straight, on_lower_arc, on_upper_arc,
+         on_ellipse) = self._segments(θ_all, inputs)
+
+        dd2_dθ = np.zeros(θ_all.size)
+
+        θ = θ_all[on_straight]
+        dd2_dθ[on_straight] = 2 * (R0 - r_ot)**2 * np.sin(θ) / np.cos(θ)**3
+
+        for mask, a, b, y in [(on_lower_arc, e1_a, e1_b, -hhs),
+                              (on_upper_arc, e1_a, e1_b, +hhs),
+                              (on_ellipse, e_a, e_b, 0)]:
+            θ = θ_all[mask]
+            d = util.polar_offset_ellipse(a=a, b=b, x=R - R0, y=y, t=θ)
+            dd_dθ = util.polar_offset_ellipse_radius_dt(a=a,
+                                                        b=b,
+                                                        x=R - R0,
+                                                        y=y,
+                                                        t=θ)
+            dd2_dθ[mask] = 2 * d * dd_dθ
+        J["d_sq", "θ"] = dd2_dθ
+
     def plot(self, ax=None, **kwargs):
         size = 100
         color = "black"
@@ -658,6 +721,18 @@ class ThreeArcDeeTFSet(om.ExplicitComponent):
                         lower=0,
                         desc="Elongation of the elliptical arc")
 
+    def _segments(self, θ, inputs):
+        """Boundary segments that the angles θ point at
+
+        Shared by compute and compute_partials so that the two always
+        agree on the piecewise boundaries.
+        """
+        r_ot = inputs["Ib TF R_out"]
+        R = r_ot + inputs["r_c"]
+        hhs = inputs["hhs"]
+        e_b = hhs + inputs["r_c"]
+        return _dee_segments(θ, inputs["R0"], r_ot, R, e_b, hhs)
+
     def compute(self, inputs, outputs):
         size = self._get_var_meta("θ", "size")
         R0 = inputs["R0"]
@@ -685,17 +760,8 @@ class ThreeArcDeeTFSet(om.ExplicitComponent):
         outputs["V_enc"] = v_1 + v_2 + v_3
         outputs["bore"] = r_c + e_a
 
-        θ1 = cs_safe_arctan2(e_b, R - R0)
-        θ2 = cs_safe_arctan2(hhs, r_ot - R0)
-        θ3 = cs_safe_arctan2(-hhs, r_ot - R0)
-        θ4 = cs_safe_arctan2(-e_b, R - R0)
-
-        θ = θ_all
-        on_ellipse = (θ4 < θ) * (θ < θ1)
-        on_upper_circ = (θ1 <= θ) * (θ < θ2)
-        on_lower_circ = (θ3 < θ) * (θ <= θ4)
-        on_straight = np.logical_or(θ2 <= θ, θ <= θ3)
-        # abbreviations for easier writing
+        (on_straight, on_lower_circ, on_upper_circ,
+         on_ellipse) = self._segments(θ_all, inputs)
 
         d2 = np.zeros(size, dtype=np.cdouble)
 
@@ -727,7 +793,10 @@ class ThreeArcDeeTFSet(om.ExplicitComponent):
         self.declare_partials("d_sq", ["Ib TF R_out", "e_a", "hhs", "r_c"],
                               method="cs")
         self.declare_partials("d_sq", ["R0"], method="cs")
-        self.declare_partials("d_sq", ["θ"], method="cs")
+        size = self._get_var_meta("θ", "size")
+        self.declare_partials("d_sq", ["θ"],
+                              rows=range(size),
+                              cols=range(size))
         self.declare_partials("Ob TF R_in", ["e_a", "r_c", "Ib TF R_out"],
                               val=1)
         self.declare_partials("constraint_axis_within_coils",
@@ -778,6 +847,29 @@ class ThreeArcDeeTFSet(om.ExplicitComponent):
         J["e_κ", "r_c"] = 1 / e_a
         J["e_κ", "e_a"] = -(hhs + r_c) / e_a**2
 
+        R0 = inputs["R0"]
+        θ_all = inputs["θ"]
+        (on_straight, on_lower_circ, on_upper_circ,
+         on_ellipse) = self._segments(θ_all, inputs)
+
+        dd2_dθ = np.zeros(θ_all.size)
+
+        θ = θ_all[on_straight]
+        dd2_dθ[on_straight] = 2 * (R0 - r_ot)**2 * np.sin(θ) / np.cos(θ)**3
+
+        for mask, a, b, y in [(on_lower_circ, r_c, r_c, -hhs),
+                              (on_upper_circ, r_c, r_c, +hhs),
+                              (on_ellipse, e_a, e_b, 0)]:
+            θ = θ_all[mask]
+            d = util.polar_offset_ellipse(a=a, b=b, x=R - R0, y=y, t=θ)
+            dd_dθ = util.polar_offset_ellipse_radius_dt(a=a,
+                                                        b=b,
+                                                        x=R - R0,
+                                                        y=y,
+                                                        t=θ)
+            dd2_dθ[mask] = 2 * d * dd_dθ
+        J["d_sq", "θ"] = dd2_dθ
+
     def plot(self, ax=None, **kwargs):
         size = 100
         color = "black"
@@ -1,10 +1,11 @@
+import functools
 import numpy as np
 from math import pi as π
-import scipy as scipy
 from scipy.special import ellipe, hyp2f1
 from numpy import sin, cos
 
 import openmdao.api as om
+from openmdao.components.ks_comp import KSfunction
 from openmdao.utils.cs_safe import abs as cs_safe_abs
 from openmdao.utils.cs_safe import arctan2 as cs_safe_arctan2
 
@@ -730,6 +731,96 @@ class Softmax(om.ExplicitComponent):
         J['z', 'y'] = dz_dy
 
 
+class DifferenceKS(om.ExplicitComponent):
+    r"""KS aggregate of the elementwise difference of two arrays
+
+    Equivalent to an ExecComp computing :math:`c = a - b` followed by an
+    :class:`openmdao.api.KSComp`. With the default ``lower_flag=True``, the
+    output is
+
+    .. math::
+
+       g &= u - (a - b) \\
+       \mathrm{KS} &= \max(g) + \frac{1}{ρ}
+           \log\left(\sum \exp(ρ (g - \max(g)))\right)
+
+    where :math:`u` is the ``upper`` option. The resulting constraint
+    :math:`\mathrm{KS} \le 0` is approximately :math:`\min(a - b) \ge u`.
+
+    Options
+    -------
+    units : str
+        Units of a, b, and KS. Default is None.
+    rho : float
+        Constraint aggregation factor. Default is 50.
+    upper : float
+        Bound for the difference. Default is 0.
+    lower_flag : bool
+        If True (default), the difference is bounded from below.
+    add_constraint : bool
+        If True, add the constraint KS ≤ 0 to the problem.
+        Default is False.
+    ref : float
+        Reference for the constraint, if added. Default is None.
+
+    Inputs
+    ------
+    a : array
+        Minuend values
+    b : array
+        Subtrahend values; same shape as a.
+
+    Outputs
+    -------
+    KS : float
+        Aggregated constraint value. Satisfied when ≤ 0.
+    """
+    def initialize(self):
+        self.options.declare('units', default=None, allow_none=True)
+        self.options.declare('rho', default=50.0)
+        self.options.declare('upper', default=0.0)
+        self.options.declare('lower_flag', default=True)
+        self.options.declare('add_constraint', default=False)
+        self.options.declare('ref', default=None, allow_none=True)
+
+    def setup(self):
+        u = self.options['units']
+        self.add_input("a", shape_by_conn=True, units=u, desc="Minuend")
+        self.add_input("b",
+                       shape_by_conn=True,
+                       copy_shape="a",
+                       units=u,
+                       desc="Subtrahend")
+        self.add_output("KS", units=u, desc="Aggregated constraint value")
+        if self.options['add_constraint']:
+            self.add_constraint("KS", upper=0.0, ref=self.options['ref'])
+
+    def _constraint_values(self, inputs):
+        g = inputs["a"] - inputs["b"] - self.options['upper']
+        if self.options['lower_flag']:
+            g = -g
+        return g
+
+    def compute(self, inputs, outputs):
+        g = self._constraint_values(inputs)
+        outputs["KS"] = KSfunction.compute(g, self.options['rho'])
+
+    def setup_partials(self):
+        size = self._get_var_meta("a", "size")
+        self.declare_partials("KS", ["a", "b"],
+                              rows=np.zeros(size, dtype=int),
+                              cols=range(size))
+
+    def compute_partials(self, inputs, J):
+        g = self._constraint_values(inputs)
+        dKS_dg = KSfunction.derivatives(g, self.options['rho'])[0]
+        dKS_da = dKS_dg.flatten()
+        if self.options['lower_flag']:
+            dKS_da = -dKS_da
+        J["KS", "a"] = dKS_da
+        J["KS", "b"] = -dKS_da
+
+
 class PolygonalTorusVolume(om.ExplicitComponent):
     r"""A torus specified by (R, Z) points
 
@@ -794,10 +885,13 @@ class PolygonalTorusVolume(om.ExplicitComponent):
         J["V", "Z"] = dV_dz0 + np.roll(dV_dz1, 1)
 
 
+@functools.lru_cache(maxsize=None)
 def most_common_isotope(sp):
     """A Particle of the most common isotope and
     maximum charge for the given species.
 
+    Results are cached, since constructing plasmapy Particles is slow.
+
     Parameters
     ----------
     sp : str
@@ -809,11 +903,7 @@ def most_common_isotope(sp):
     """
     isotopes = common_isotopes(sp)
     max_charge = atomic_number(sp)
-    abundances = []
-    for i in isotopes:
-        abundances.append(isotopic_abundance(i))
-    isotope_index = np.argmax(abundances)
-    most_common_isotope = isotopes[isotope_index]
+    most_common_isotope = max(isotopes, key=isotopic_abundance)
     mass_number = Particle(most_common_isotope).mass_number
     impurity = Particle(max_charge, Z=max_charge, mass_numb=mass_number)
     return impurity
@@ -835,6 +925,21 @@ def tube_segment_volume_derivatives(r_i, r_o, h):
     return {'r_i': dVdr_i, 'r_o': dVdr_o, 'h': dVdh}
 
 
+def tube_segment_volume_and_derivatives(r_i, r_o, h):
+    """Volume of a finite tube's wall and its derivatives
+
+    Returns
+    -------
+    V : float
+        as from tube_segment_volume
+    dV : dict
+        as from tube_segment_volume_derivatives
+    """
+    area = π * (r_o**2 - r_i**2)
+    dV = {'r_i': -2 * π * h * r_i, 'r_o': 2 * π * h * r_o, 'h': area}
+    return area * h, dV
+
+
 def ellipse_perimeter_simple(a, b):
     """Often seen as √((1 + κ^2)/2)
 
@@ -926,21 +1031,19 @@ def ellipse_perimeter_derivatives(a, b):
     ----------
     https://www.mathematica-journal.com/2009/11/23/on-the-perimeter-of-an-ellipse/
     """
-    def epd(a, b):
-        hyp1 = hyp2f1(-1 / 4, 1 / 4, 1, ((a**2 - b**2) / (a**2 + b**2))**2)
-        num1 = 2**(1 / 2) * a * π * hyp1
-        den1 = (a**2 + b**2)**(1 / 2)
-        term1 = num1 / den1
-
-        hyp2 = hyp2f1(3 / 4, 5 / 4, 2, ((a**2 - b**2) / (a**2 + b**2))**2)
-        num2 = 8 * a * (a - b) * b**2 * (a + b) / (a**2 + b**2)**3 * π
-        num2 = num2 * hyp2 * (a**2 + b**2)**(1 / 2)
-        den2 = 8 * 2**(1 / 2)
-        term2 = num2 / den2
-        return term1 - term2
-
-    dPda = epd(a, b)
-    dPdb = epd(b, a)  # formula is symmetric
+    r2 = a**2 + b**2
+    d2 = a**2 - b**2
+    sqrt_r2 = np.sqrt(r2)
+    # both hypergeometric factors are symmetric in a and b,
+    # so they are shared by the two derivatives
+    u = (d2 / r2)**2
+    hyp1 = hyp2f1(-1 / 4, 1 / 4, 1, u)
+    hyp2 = hyp2f1(3 / 4, 5 / 4, 2, u)
+
+    c1 = 2**(1 / 2) * π * hyp1 / sqrt_r2
+    c2 = π * hyp2 * d2 * a * b / (2**(1 / 2) * r2**2 * sqrt_r2)
+    dPda = a * c1 - b * c2
+    dPdb = b * c1 + a * c2
     return {'a': dPda, 'b': dPdb}
 
 
@@ -966,11 +1069,29 @@ def ellipse_perimeter_ramanujan(a, b):
 def ellipse_perimeter_ramanujan_derivatives(a, b):
     """Partial derivatives for ellipse_perimeter_ramanujan
     """
-    dPda = π * (3 - (3 * a + 5 * b) / np.sqrt((3 * a + b) * (a + 3 * b)))
-    dPdb = π * (3 - (5 * a + 3 * b) / np.sqrt((3 * a + b) * (a + 3 * b)))
+    sq = np.sqrt((3 * a + b) * (a + 3 * b))
+    dPda = π * (3 - (3 * a + 5 * b) / sq)
+    dPdb = π * (3 - (5 * a + 3 * b) / sq)
     return {'a': dPda, 'b': dPdb}
 
 
+def ellipse_perimeter_ramanujan_and_derivatives(a, b):
+    """Ramanujan's ellipse perimeter and its partial derivatives
+
+    Returns
+    -------
+    P : float
+        as from ellipse_perimeter_ramanujan
+    dP : dict
+        as from ellipse_perimeter_ramanujan_derivatives
+    """
+    sq = np.sqrt((3 * a + b) * (a + 3 * b))
+    P = π * (3 * (a + b) - sq)
+    dPda = π * (3 - (3 * a + 5 * b) / sq)
+    dPdb = π * (3 - (5 * a + 3 * b) / sq)
+    return P, {'a': dPda, 'b': dPdb}
+
+
 def polar_offset_ellipse(a, b, x, y, t):
     r"""Radius to an offset ellipse
 
@@ -1105,6 +1226,48 @@ def polar_offset_ellipse_radius_dy(a, b, x, y, t):
     return d
 
 
+def polar_offset_ellipse_radius_dt(a, b, x, y, t):
+    r"""Derivative wrt the polar angle of the radius polar_offset_ellipse
+
+    With :math:`\rho = N / D` as in :func:`polar_offset_ellipse`,
+
+    .. math ::
+
+       \frac{d \rho}{d \theta} = \frac{N' - \rho D'}{D}
+
+    where the primes denote derivatives with respect to :math:`\theta`.
+
+    Parameters
+    ----------
+    a : float
+       horizontal semi-axis of the ellipse
+    b : float
+       vertical semi-axis of the ellipse
+    x : float
+       horizontal ellipse center location
+    y : float
+       vertical ellipse center location
+    t : float
+       polar angle
+
+    Returns
+    -------
+    dr/dt : float
+    """
+    s = sin(t)
+    c = cos(t)
+    root = np.sqrt((b**2 - y**2) * c**2 + 2 * x * y * c * s +
+                   (a**2 - x**2) * s**2)
+    droot = (c * s * (a**2 - x**2 - b**2 + y**2) + x * y *
+             (c**2 - s**2)) / root
+    numer = b**2 * x * c + a**2 * y * s + a * b * root
+    dnumer = -b**2 * x * s + a**2 * y * c + a * b * droot
+    denom = (b * c)**2 + (a * s)**2
+    ddenom = 2 * c * s * (a**2 - b**2)
+    d = (dnumer - numer * ddenom / denom) / denom
+    return d
+
+
 def torus_surface_area(R, a, b=None):
     """Simple formula for surface area of a (elliptical) torus
 
@@ -1130,6 +1293,39 @@ def torus_surface_area(R, a, b=None):
     return sa
 
 
+def torus_surface_area_derivatives(R, a, b=None):
+    """Derivatives for torus_surface_area
+
+    Parameters
+    ----------
+    R : float
+       major radius
+    a : float
+       horizontal minor radius
+    b : float [optional]
+       vertical minor radius
+
+    Returns
+    -------
+    Dict of
+    R : float
+       derivative with respect to R
+    a : float
+       derivative with respect to a
+    b : float
+       derivative with respect to b. Only present if b is given.
+    """
+    if b is not None:
+        circumference, dcirc = ellipse_perimeter_ramanujan_and_derivatives(
+            a, b)
+        return {
+            "R": 2 * π * circumference,
+            "a": 2 * π * R * dcirc["a"],
+            "b": 2 * π * R * dcirc["b"]
+        }
+    return {"R": 4 * π**2 * a, "a": 4 * π**2 * R}
+
+
 def torus_volume(R, a, b=None):
     """Volume of a (elliptical) torus
 
@@ -1155,6 +1351,37 @@ def torus_volume(R, a, b=None):
     return V
 
 
+def torus_volume_derivatives(R, a, b=None):
+    """Derivatives for torus_volume
+
+    Parameters
+    ----------
+    R : float
+       major radius
+    a : float
+       horizontal minor radius
+    b : float [optional]
+       vertical minor radius
+
+    Returns
+    -------
+    Dict of
+    R : float
+       derivative with respect to R
+    a : float
+       derivative with respect to a
+    b : float
+       derivative with respect to b. Only present if b is given.
+    """
+    if b is None:
+        return {"R": 2 * π**2 * a**2, "a": 4 * π**2 * R * a}
+    return {
+        "R": 2 * π**2 * a * b,
+        "a": 2 * π**2 * R * b,
+        "b": 2 * π**2 * R * a
+    }
+
+
 def half_ellipse_torus_volume(R, a, b):
     """Volume of a torus with a cross section
     shaped like half of an ellipse (vertical slice)
@@ -1207,6 +1434,133 @@ def half_ellipse_torus_volume_derivatives(R, a, b):
     return {"a": dVda, "b": dVdb, "R": dVdR}
 
 
+def _RZ_upper_and_lower(R, Z, nx):
+    """Upper and lower halves of a closed curve on a uniform R grid
+
+    Linear interpolation, with zero outside each half's range of R.
+    The three RZ integrators are often called on the same curve, so the
+    sampled halves of real curves are memoized on the contents of R and Z
+    (not on the array identities, which would go stale if the inputs are
+    modified in place). The returned arrays are then read-only.
+    Complex R or Z, as under complex step, bypass the memo.
+
+    Returns
+    -------
+    x : array
+        nx points from the minimum to the maximum R
+    ypos, yneg : array
+        Z of the upper (Z >= 0) and lower (Z <= 0) halves at x
+    """
+    if np.iscomplexobj(R) or np.iscomplexobj(Z):
+        return _RZ_sample_complex(np.asarray(R), np.asarray(Z), nx)
+    R = np.ascontiguousarray(R, dtype=np.float64)
+    Z = np.ascontiguousarray(Z, dtype=np.float64)
+    return _RZ_sample(R.tobytes(), Z.tobytes(), nx)
+
+
+@functools.lru_cache(maxsize=4)
+def _RZ_sample(R_bytes, Z_bytes, nx):
+    R = np.frombuffer(R_bytes)
+    Z = np.frombuffer(Z_bytes)
+    x = np.linspace(R.min(), R.max(), nx)
+
+    def half(inds):
+        order = inds[np.argsort(R[inds])]
+        return np.interp(x, R[order], Z[order], left=0, right=0)
+
+    samples = (x, half(np.flatnonzero(Z >= 0)), half(np.flatnonzero(Z <= 0)))
+    for a in samples:
+        a.flags.writeable = False
+    return samples
+
+
+def _RZ_sample_complex(R, Z, nx):
+    """Sampled halves of a complex-valued curve, without the memo
+
+    np.interp requires real sample points, so the interpolation is
+    written out. Points are ordered and bracketed by their real parts.
+    """
+    x = np.linspace(R[np.argmin(R.real)], R[np.argmax(R.real)], nx)
+
+    def half(inds):
+        order = inds[np.argsort(R[inds].real)]
+        r = R[order]
+        z = Z[order]
+        j = np.clip(np.searchsorted(r.real, x.real, side='right') - 1, 0,
+                    len(r) - 2)
+        t = (x - r[j]) / (r[j + 1] - r[j])
+        inside = (x.real >= r[0].real) & (x.real <= r[-1].real)
+        return np.where(inside, z[j] + t * (z[j + 1] - z[j]), 0)
+
+    return (x, half(np.flatnonzero(Z.real >= 0)),
+            half(np.flatnonzero(Z.real <= 0)))
+
+
+def clear_rz_cache():
+    """Discard the memoized samples used by the RZ integrators"""
+    _RZ_sample.cache_clear()
+
+
+def _RZ_sample_adjoint(R, Z, nx, x_bar, h_bar, ypos_bar, yneg_bar):
+    """Pull sensitivities of the sampled halves back to the curve points
+
+    Reverse of _RZ_upper_and_lower: given the derivatives of some scalar
+    with respect to the sample points x, their spacing h, and the sampled
+    halves, returns its derivatives with respect to each R and Z.
+    Each sample depends only on the two curve points that bracket it,
+    and x depends only on the points at the minimum and maximum R.
+    R and Z must be real.
+
+    Returns
+    -------
+    dR, dZ : array
+        Same shape as R and Z
+    """
+    R = np.asarray(R, dtype=float)
+    Z = np.asarray(Z, dtype=float)
+    x, _, _ = _RZ_upper_and_lower(R, Z, nx)
+    x_bar = np.array(x_bar, dtype=float)
+    dR = np.zeros(R.shape)
+    dZ = np.zeros(Z.shape)
+
+    for inds, y_bar in ((np.flatnonzero(Z >= 0), ypos_bar),
+                        (np.flatnonzero(Z <= 0), yneg_bar)):
+        order = inds[np.argsort(R[inds])]
+        r = R[order]
+        z = Z[order]
+        # outside each half's range of R the samples are fixed at zero
+        inside = (x >= r[0]) & (x <= r[-1])
+        xk = x[inside]
+        yb = y_bar[inside]
+        # bracketing points, matching np.interp
+        j = np.clip(np.searchsorted(r, xk, side='right') - 1, 0, len(r) - 2)
+        Δr = r[j + 1] - r[j]
+        t = (xk - r[j]) / Δr
+        slope = (z[j + 1] - z[j]) / Δr
+        np.add.at(dZ, order[j], yb * (1 - t))
+        np.add.at(dZ, order[j + 1], yb * t)
+        np.add.at(dR, order[j], yb * slope * (t - 1))
+        np.add.at(dR, order[j + 1], -yb * slope * t)
+        x_bar[inside] += yb * slope
+
+    # x_k = x_min + k h, with h = (x_max - x_min) / (nx - 1)
+    h_bar = h_bar + np.dot(np.arange(nx), x_bar)
+    dR[np.argmin(R)] += np.sum(x_bar) - h_bar / (nx - 1)
+    dR[np.argmax(R)] += h_bar / (nx - 1)
+    return dR, dZ
+
+
+def _trapz_uniform(y, dx):
+    """Trapezoid rule on a uniform grid with spacing dx"""
+    return dx * (np.sum(y) - (y[0] + y[-1]) / 2)
+
+
+def _trapz_weights(nx):
+    w = np.ones(nx)
+    w[[0, -1]] = 1 / 2
+    return w
+
+
 # not used
 def cross_section_area_RZ(R, Z, nx=1000):
     """Cross-sectional area of a poloidal slice
@@ -1226,21 +1580,9 @@ def cross_section_area_RZ(R, Z, nx=1000):
         cross-sectional area
     """
 
-    x = np.linspace(min(R), max(R), nx)
+    x, ypos, yneg = _RZ_upper_and_lower(R, Z, nx)
 
-    pos_inds = (Z >= 0)
-    neg_inds = (Z <= 0)
-
-    ypos = scipy.interpolate.interp1d(R[pos_inds],
-                                      Z[pos_inds],
-                                      bounds_error=False,
-                                      fill_value=0)
-    yneg = scipy.interpolate.interp1d(R[neg_inds],
-                                      Z[neg_inds],
-                                      bounds_error=False,
-                                      fill_value=0)
-
-    A = np.trapz(ypos(x) - yneg(x), x=x)
+    A = _trapz_uniform(ypos - yneg, x[1] - x[0])
 
     return A
 
@@ -1264,27 +1606,62 @@ def surface_area_RZ(R, Z, nx=1000):
         toroidal plasma volume
     """
 
-    x = np.linspace(min(R), max(R), nx)
+    x, ypos, yneg = _RZ_upper_and_lower(R, Z, nx)
+
+    dx = x[1] - x[0]
+    gradypos = np.gradient(ypos, dx)
+    S1 = 2 * np.pi * _trapz_uniform(x * np.sqrt(1 + gradypos**2), dx)
 
-    pos_inds = (Z >= 0)
-    neg_inds = (Z <= 0)
+    gradyneg = np.gradient(yneg, dx)
+    S2 = 2 * np.pi * _trapz_uniform(x * np.sqrt(1 + gradyneg**2), dx)
 
-    ypos = scipy.interpolate.interp1d(R[pos_inds],
-                                      Z[pos_inds],
-                                      bounds_error=False,
-                                      fill_value=0)
-    yneg = scipy.interpolate.interp1d(R[neg_inds],
-                                      Z[neg_inds],
-                                      bounds_error=False,
-                                      fill_value=0)
+    return S1 + S2
 
-    gradypos = np.gradient(ypos(x)) / np.gradient(x)
-    S1 = 2 * np.pi * np.trapz(x * np.sqrt(1 + gradypos**2), x=x)
 
-    gradyneg = np.gradient(yneg(x)) / np.gradient(x)
-    S2 = 2 * np.pi * np.trapz(x * np.sqrt(1 + gradyneg**2), x=x)
+def surface_area_RZ_derivatives(R, Z, nx=1000):
+    """Derivatives of surface_area_RZ with respect to the curve points
 
-    return S1 + S2
+    Parameters
+    ----------
+    R : fltarray
+        radial positions of separatrix
+    Z : fltarray
+        vertical positions of separatrix
+    nx : init
+        number of horizontal slices used for integration
+
+    Returns
+    -------
+    Dict of
+    R : array
+        derivatives with respect to each R
+    Z : array
+        derivatives with respect to each Z
+    """
+    x, ypos, yneg = _RZ_upper_and_lower(R, Z, nx)
+    dx = x[1] - x[0]
+    w = _trapz_weights(nx)
+
+    h_bar = 0
+    x_bar = np.zeros(nx)
+    y_bars = []
+    for y in (ypos, yneg):
+        grady = np.gradient(y, dx)
+        q = np.sqrt(1 + grady**2)
+        h_bar += 2 * π * np.sum(w * x * q)
+        x_bar += 2 * π * dx * w * q
+        # through np.gradient, which scales as 1 / dx
+        g_bar = 2 * π * dx * w * x * grady / q
+        h_bar -= np.sum(g_bar * grady) / dx
+        y_bar = np.zeros(nx)
+        y_bar[[0, 1]] += [-g_bar[0], g_bar[0]]
+        y_bar[2:] += g_bar[1:-1] / 2
+        y_bar[:-2] -= g_bar[1:-1] / 2
+        y_bar[[-2, -1]] += [-g_bar[-1], g_bar[-1]]
+        y_bars.append(y_bar / dx)
+
+    dR, dZ = _RZ_sample_adjoint(R, Z, nx, x_bar, h_bar, *y_bars)
+    return {"R": dR, "Z": dZ}
 
 
 # not used
@@ -1306,21 +1683,42 @@ def volume_RZ(R, Z, nx=1000):
         toroidal plasma volume
     """
 
-    x = np.linspace(min(R), max(R), nx)
-
-    pos_inds = (Z >= 0)
-    neg_inds = (Z <= 0)
-
-    ypos = scipy.interpolate.interp1d(R[pos_inds],
-                                      Z[pos_inds],
-                                      bounds_error=False,
-                                      fill_value=0)
-    yneg = scipy.interpolate.interp1d(R[neg_inds],
-                                      Z[neg_inds],
-                                      bounds_error=False,
-                                      fill_value=0)
+    x, ypos, yneg = _RZ_upper_and_lower(R, Z, nx)
 
     # volume by cylindrical shells
-    V = 2 * np.pi * np.trapz(x * (ypos(x) - yneg(x)), x=x)
+    V = 2 * np.pi * _trapz_uniform(x * (ypos - yneg), x[1] - x[0])
 
     return V
+
+
+def volume_RZ_derivatives(R, Z, nx=1000):
+    """Derivatives of volume_RZ with respect to the curve points
+
+    Parameters
+    ----------
+    R : fltarray
+        radial positions of separatrix
+    Z : fltarray
+        vertical positions of separatrix
+    nx : init
+        number of horizontal slices used for integration
+
+    Returns
+    -------
+    Dict of
+    R : array
+        derivatives with respect to each R
+    Z : array
+        derivatives with respect to each Z
+    """
+    x, ypos, yneg = _RZ_upper_and_lower(R, Z, nx)
+    dx = x[1] - x[0]
+    w = _trapz_weights(nx)
+    height = ypos - yneg
+
+    h_bar = 2 * π * np.sum(w * x * height)
+    x_bar = 2 * π * dx * w * height
+    height_bar = 2 * π * dx * w * x
+    dR, dZ = _RZ_sample_adjoint(R, Z, nx, x_bar, h_bar, height_bar,
+                                -height_bar)
+    return {"R": dR, "Z": dZ}